@@ -1,657 +1,1099 @@
-from typing import Any, Union, List, Optional, Generic, TypeVar
+from typing import Any, Callable, Dict, Tuple, Union, List, Optional, Generic, TypeVar
+from collections import OrderedDict
 from datetime import datetime
+from itertools import repeat
+from types import MappingProxyType
+import functools
+import sys
+import threading
 from .types import OperatorDef, OperatorArg, Field, DynamicValueType, TypeMismatchError
 from .values import DynamicValue
 
 T = TypeVar('T')
 U = TypeVar('U')  # For handling nested generic types
 
+# Enum members bound to module globals to save an attribute lookup in every builder call
+_DVT_STRING = DynamicValueType.STRING
+_DVT_NUMBER = DynamicValueType.NUMBER
+_DVT_DATE = DynamicValueType.DATE
+_DVT_LIST = DynamicValueType.LIST
+_DVT_OBJECT = DynamicValueType.OBJECT
+
+# Operator names returned by the builders, interned once so downstream comparisons and
+# dict lookups on them can short-circuit on identity
+_OP_EQUALS = sys.intern("equals")
+_OP_DOES_NOT_EQUAL = sys.intern("does not equal")
+_OP_GREATER_THAN = sys.intern("greater than")
+_OP_LESS_THAN = sys.intern("less than")
+_OP_GREATER_THAN_OR_EQUAL_TO = sys.intern("greater than or equal to")
+_OP_LESS_THAN_OR_EQUAL_TO = sys.intern("less than or equal to")
+_OP_BETWEEN = sys.intern("between")
+_OP_NOT_BETWEEN = sys.intern("not between")
+_OP_IS_EVEN = sys.intern("is even")
+_OP_IS_ODD = sys.intern("is odd")
+_OP_IS_POSITIVE = sys.intern("is positive")
+_OP_IS_NEGATIVE = sys.intern("is negative")
+_OP_IS_ZERO = sys.intern("is zero")
+_OP_IS_NOT_ZERO = sys.intern("is not zero")
+_OP_IS_A_MULTIPLE_OF = sys.intern("is a multiple of")
+_OP_IS_NOT_A_MULTIPLE_OF = sys.intern("is not a multiple of")
+_OP_IS_A_POWER_OF = sys.intern("is a power of")
+_OP_CONTAINS = sys.intern("contains")
+_OP_DOES_NOT_CONTAIN = sys.intern("does not contain")
+_OP_IS_EMPTY = sys.intern("is empty")
+_OP_IS_NOT_EMPTY = sys.intern("is not empty")
+_OP_STARTS_WITH = sys.intern("starts with")
+_OP_ENDS_WITH = sys.intern("ends with")
+_OP_IS_INCLUDED_IN = sys.intern("is included in")
+_OP_MATCHES_REGEX = sys.intern("matches RegEx")
+_OP_DOES_NOT_MATCH_REGEX = sys.intern("does not match RegEx")
+_OP_IS_A_VALID_EMAIL_ADDRESS = sys.intern("is a valid email address")
+_OP_IS_NOT_A_VALID_EMAIL_ADDRESS = sys.intern("is not a valid email address")
+_OP_IS_A_VALID_URL = sys.intern("is a valid URL")
+_OP_IS_NOT_A_VALID_URL = sys.intern("is not a valid URL")
+_OP_IS_A_VALID_IP_ADDRESS = sys.intern("is a valid IP address")
+_OP_IS_NOT_A_VALID_IP_ADDRESS = sys.intern("is not a valid IP address")
+_OP_IS_UPPERCASE = sys.intern("is uppercase")
+_OP_IS_LOWERCASE = sys.intern("is lowercase")
+_OP_IS_NUMERIC = sys.intern("is numeric")
+_OP_CONTAINS_ONLY_DIGITS = sys.intern("contains only digits")
+_OP_CONTAINS_ONLY_LETTERS = sys.intern("contains only letters")
+_OP_CONTAINS_ONLY_DIGITS_AND_LETTERS = sys.intern("contains only digits and letters")
+_OP_IS_IN_THE_PAST = sys.intern("is in the past")
+_OP_IS_IN_THE_FUTURE = sys.intern("is in the future")
+_OP_DAYS_AGO = sys.intern("days ago")
+_OP_IS_LESS_THAN_N_DAYS_AGO = sys.intern("is less than N days ago")
+_OP_IS_MORE_THAN_N_DAYS_AGO = sys.intern("is more than N days ago")
+_OP_DAYS_FROM_NOW = sys.intern("days from now")
+_OP_IS_LESS_THAN_N_DAYS_FROM_NOW = sys.intern("is less than N days from now")
+_OP_IS_MORE_THAN_N_DAYS_FROM_NOW = sys.intern("is more than N days from now")
+_OP_IS_TODAY = sys.intern("is today")
+_OP_IS_THIS_WEEK = sys.intern("is this week")
+_OP_IS_THIS_MONTH = sys.intern("is this month")
+_OP_IS_THIS_YEAR = sys.intern("is this year")
+_OP_IS_NEXT_WEEK = sys.intern("is next week")
+_OP_IS_NEXT_MONTH = sys.intern("is next month")
+_OP_IS_NEXT_YEAR = sys.intern("is next year")
+_OP_IS_LAST_WEEK = sys.intern("is last week")
+_OP_IS_LAST_MONTH = sys.intern("is last month")
+_OP_IS_LAST_YEAR = sys.intern("is last year")
+_OP_AFTER = sys.intern("after")
+_OP_ON_OR_AFTER = sys.intern("on or after")
+_OP_BEFORE = sys.intern("before")
+_OP_ON_OR_BEFORE = sys.intern("on or before")
+_OP_IS_OF_LENGTH = sys.intern("is of length")
+_OP_IS_NOT_OF_LENGTH = sys.intern("is not of length")
+_OP_IS_LONGER_THAN = sys.intern("is longer than")
+_OP_IS_SHORTER_THAN = sys.intern("is shorter than")
+_OP_CONTAINS_ALL_OF = sys.intern("contains all of")
+_OP_CONTAINS_ANY_OF = sys.intern("contains any of")
+_OP_CONTAINS_NONE_OF = sys.intern("contains none of")
+_OP_IS_EQUAL_TO = sys.intern("is equal to")
+_OP_IS_NOT_EQUAL_TO = sys.intern("is not equal to")
+_OP_CONTAINS_DUPLICATES = sys.intern("contains duplicates")
+_OP_DOES_NOT_CONTAIN_DUPLICATES = sys.intern("does not contain duplicates")
+_OP_CONTAINS_OBJECT_WITH_KEY_VALUE = sys.intern("contains object with key & value")
+_OP_HAS_UNIQUE_ELEMENTS = sys.intern("has unique elements")
+_OP_IS_A_SUBLIST_OF = sys.intern("is a sublist of")
+_OP_IS_A_SUPERLIST_OF = sys.intern("is a superlist of")
+_OP_IS_TRUE = sys.intern("is true")
+_OP_IS_FALSE = sys.intern("is false")
+
+# Results of the argument-less builders, shared by every call. The empty argument
+# container is an immutable tuple so no caller can mutate the shared value.
+_EMPTY_ARGS: tuple = ()
+_RES_IS_EVEN = (_OP_IS_EVEN, _EMPTY_ARGS)
+_RES_IS_ODD = (_OP_IS_ODD, _EMPTY_ARGS)
+_RES_IS_POSITIVE = (_OP_IS_POSITIVE, _EMPTY_ARGS)
+_RES_IS_NEGATIVE = (_OP_IS_NEGATIVE, _EMPTY_ARGS)
+_RES_IS_ZERO = (_OP_IS_ZERO, _EMPTY_ARGS)
+_RES_IS_NOT_ZERO = (_OP_IS_NOT_ZERO, _EMPTY_ARGS)
+_RES_IS_EMPTY = (_OP_IS_EMPTY, _EMPTY_ARGS)
+_RES_IS_NOT_EMPTY = (_OP_IS_NOT_EMPTY, _EMPTY_ARGS)
+_RES_IS_A_VALID_EMAIL_ADDRESS = (_OP_IS_A_VALID_EMAIL_ADDRESS, _EMPTY_ARGS)
+_RES_IS_NOT_A_VALID_EMAIL_ADDRESS = (_OP_IS_NOT_A_VALID_EMAIL_ADDRESS, _EMPTY_ARGS)
+_RES_IS_A_VALID_URL = (_OP_IS_A_VALID_URL, _EMPTY_ARGS)
+_RES_IS_NOT_A_VALID_URL = (_OP_IS_NOT_A_VALID_URL, _EMPTY_ARGS)
+_RES_IS_A_VALID_IP_ADDRESS = (_OP_IS_A_VALID_IP_ADDRESS, _EMPTY_ARGS)
+_RES_IS_NOT_A_VALID_IP_ADDRESS = (_OP_IS_NOT_A_VALID_IP_ADDRESS, _EMPTY_ARGS)
+_RES_IS_UPPERCASE = (_OP_IS_UPPERCASE, _EMPTY_ARGS)
+_RES_IS_LOWERCASE = (_OP_IS_LOWERCASE, _EMPTY_ARGS)
+_RES_IS_NUMERIC = (_OP_IS_NUMERIC, _EMPTY_ARGS)
+_RES_CONTAINS_ONLY_DIGITS = (_OP_CONTAINS_ONLY_DIGITS, _EMPTY_ARGS)
+_RES_CONTAINS_ONLY_LETTERS = (_OP_CONTAINS_ONLY_LETTERS, _EMPTY_ARGS)
+_RES_CONTAINS_ONLY_DIGITS_AND_LETTERS = (_OP_CONTAINS_ONLY_DIGITS_AND_LETTERS, _EMPTY_ARGS)
+_RES_IS_IN_THE_PAST = (_OP_IS_IN_THE_PAST, _EMPTY_ARGS)
+_RES_IS_IN_THE_FUTURE = (_OP_IS_IN_THE_FUTURE, _EMPTY_ARGS)
+_RES_IS_TODAY = (_OP_IS_TODAY, _EMPTY_ARGS)
+_RES_IS_THIS_WEEK = (_OP_IS_THIS_WEEK, _EMPTY_ARGS)
+_RES_IS_THIS_MONTH = (_OP_IS_THIS_MONTH, _EMPTY_ARGS)
+_RES_IS_THIS_YEAR = (_OP_IS_THIS_YEAR, _EMPTY_ARGS)
+_RES_IS_NEXT_WEEK = (_OP_IS_NEXT_WEEK, _EMPTY_ARGS)
+_RES_IS_NEXT_MONTH = (_OP_IS_NEXT_MONTH, _EMPTY_ARGS)
+_RES_IS_NEXT_YEAR = (_OP_IS_NEXT_YEAR, _EMPTY_ARGS)
+_RES_IS_LAST_WEEK = (_OP_IS_LAST_WEEK, _EMPTY_ARGS)
+_RES_IS_LAST_MONTH = (_OP_IS_LAST_MONTH, _EMPTY_ARGS)
+_RES_IS_LAST_YEAR = (_OP_IS_LAST_YEAR, _EMPTY_ARGS)
+_RES_CONTAINS_DUPLICATES = (_OP_CONTAINS_DUPLICATES, _EMPTY_ARGS)
+_RES_DOES_NOT_CONTAIN_DUPLICATES = (_OP_DOES_NOT_CONTAIN_DUPLICATES, _EMPTY_ARGS)
+_RES_HAS_UNIQUE_ELEMENTS = (_OP_HAS_UNIQUE_ELEMENTS, _EMPTY_ARGS)
+_RES_IS_TRUE = (_OP_IS_TRUE, _EMPTY_ARGS)
+_RES_IS_FALSE = (_OP_IS_FALSE, _EMPTY_ARGS)
+
+# Python type(s) accepted for each DynamicValueType, resolved once instead of per Argument
+_EXPECTED_PY_TYPE = {t: DynamicValue.get_expected_type(t) for t in DynamicValueType}
+
+# Upper bound on the number of rule specs memoized per builder method
+_RULE_SPEC_CACHE_SIZE = 1024
+
+# Exact types whose equal values are interchangeable, so they can be used as cache keys.
+# DynamicValue compares by identity.
+_CACHE_KEY_TYPES = frozenset((str, int, bool, type(None), DynamicValue))
+
+def _is_cache_key_safe(value: Any) -> bool:
+    """
+    Check whether a builder argument can be used in a cache key.
+
+    Equal keys must mean identical output, so floats are only accepted when non-zero
+    (0.0 == -0.0) and datetimes only when naive (equal aware datetimes may carry different
+    offsets). Containers and subclasses are never cached.
+    """
+    value_type = type(value)
+    if value_type in _CACHE_KEY_TYPES:
+        return True
+    if value_type is float:
+        return value != 0.0
+    if value_type is datetime:
+        return value.tzinfo is None
+    return False
+
+def _rule_spec_cache(method: Callable[..., tuple]) -> Callable[..., tuple]:
+    """
+    Memoize a builder method on its arguments, shared across all fields of the same class.
+
+    Builders only depend on their arguments, so repeated literals (e.g. `age.between(18, 35)`
+    in a rule-generation loop) return the same (operator, args) tuple instead of re-allocating
+    and re-validating it. Argument types are part of the key so `1`, `1.0` and `True` stay
+    distinct. Keyword calls and arguments rejected by _is_cache_key_safe (including lists and
+    tuples) bypass the cache. Specs holding a list of arguments and errors are never cached.
+    """
+    cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+    lock = threading.Lock()
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if kwargs or not all(map(_is_cache_key_safe, args)):
+            return method(self, *args, **kwargs)
+        key = (type(self), args, tuple(map(type, args)))
+        with lock:
+            spec = cache.get(key)
+            if spec is not None:
+                cache.move_to_end(key)
+                return spec
+        spec = method(self, *args)
+        if any(type(arg) is list for arg in spec[1]):
+            return spec  # Argument lists are mutable, so they are never shared between callers
+        with lock:
+            cache[key] = spec
+            if len(cache) > _RULE_SPEC_CACHE_SIZE:
+                cache.popitem(last=False)
+        return spec
+
+    wrapper.cache_clear = cache.clear  # type: ignore
+    return wrapper
+
 class Argument(Generic[T]):
     """Represents a value that could be either a primitive or dynamic value"""
+    __slots__ = ('value', 'expected_type', '_is_dynamic')
+
     def __init__(self, value: Union[T, DynamicValue], expected_type: DynamicValueType):
         self.value = value
         self.expected_type = expected_type
         self._validate_type()
+        # The value never changes after construction, so resolve its kind once
+        self._is_dynamic = isinstance(value, DynamicValue)
 
     def _validate_type(self) -> None:
         """Validate that the value matches the expected type"""
-        if isinstance(self.value, DynamicValue):
-            if self.value.value_type != self.expected_type:
-                raise TypeMismatchError(
-                    f"Dynamic value '{self.value.name}' has type {self.value.value_type.value}, "
-                    f"but {self.expected_type.value} was expected"
-                )
-        else:
-            expected_python_type = DynamicValue.get_expected_type(self.expected_type)
-            if not isinstance(self.value, expected_python_type):
-                actual_type = type(self.value).__name__
+        value = self.value
+        if type(value) is not DynamicValue:
+            if isinstance(value, _EXPECTED_PY_TYPE[self.expected_type]):
+                return
+            # DynamicValue subclasses are only probed for on this (rare) slow path
+            if not isinstance(value, DynamicValue):
+                actual_type = type(value).__name__
                 raise TypeMismatchError(
-                    f"Value {self.value} has type {actual_type}, "
+                    f"Value {value} has type {actual_type}, "
                     f"but {self.expected_type.value} was expected"
                 )
+        value_type = value.value_type
+        if value_type != self.expected_type:
+            raise TypeMismatchError(value.name, value_type.value, self.expected_type.value)
 
     def to_dict(self) -> Any:
         """Return the primitive value or dynamic value dict"""
-        if isinstance(self.value, DynamicValue):
+        if self._is_dynamic:
             return self.value.to_dict()
         return self.value  # Return the primitive value directly
 
+    @classmethod
+    def _unchecked(cls, value: Any, expected_type: DynamicValueType) -> 'Argument':
+        """Build an Argument whose value the caller has already validated"""
+        arg = cls.__new__(cls)
+        arg.value = value
+        arg.expected_type = expected_type
+        arg._is_dynamic = isinstance(value, DynamicValue)
+        return arg
+
     @classmethod
     def process(cls, arg: Any, expected_type: DynamicValueType) -> Any:
         """Process any argument into the correct format for conditions"""
-        if isinstance(arg, Argument):
-            return arg.to_dict()
-        elif isinstance(arg, DynamicValue):
-            return arg.to_dict()
-        elif isinstance(arg, list):
-            return [cls.process(item, expected_type) for item in arg]
-        elif isinstance(arg, dict):
-            return {k: cls.process(v, expected_type) for k, v in arg.items()}
-        return arg
+        dispatch = _PROCESS_DISPATCH
+        handler = dispatch.get(type(arg), _UNRESOLVED)
+        if handler is _UNRESOLVED:
+            handler = _resolve_process_handler(type(arg))
+        if handler is None:
+            return arg
+        if handler is not list and handler is not dict:
+            return handler(arg)
+
+        # Walk nested containers with an explicit stack instead of recursing. Leaves are
+        # converted in place, so flat lists are handled in a single pass.
+        root: List[Any] = [None]
+        stack = [(root, 0, arg, handler)]
+        while stack:
+            parent, key, node, handler = stack.pop()
+            if handler is list:
+                out: Any = [None] * len(node)
+                items: Any = enumerate(node)
+            else:
+                out = dict.fromkeys(node)
+                items = node.items()
+            parent[key] = out
+            for k, item in items:
+                handler = dispatch.get(type(item), _UNRESOLVED)
+                if handler is _UNRESOLVED:
+                    handler = _resolve_process_handler(type(item))
+                if handler is None:
+                    out[k] = item
+                elif handler is list or handler is dict:
+                    stack.append((out, k, item, handler))
+                else:
+                    out[k] = handler(item)
+        return root[0]
 
     def __repr__(self) -> str:
-        if isinstance(self.value, DynamicValue):
+        if self._is_dynamic:
             return f"<{self.value.name.upper()}>"
         return f"{self.value}"
 
+@functools.lru_cache(maxsize=1024)
+def _find_regex_syntax_error(pattern: str) -> Optional[str]:
+    """
+    Describe unbalanced syntax in a regex pattern, or return None if there is none.
+
+    Only escapes, character classes and groups are checked, since they are shared by the
+    common dialects. Dialect-specific constructs such as `(?<name>...)`, `\\p{L}` or `\\k<name>`
+    are left for the server to interpret.
+    """
+    depth = 0
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == '\\':
+            if i + 1 == n:
+                return "trailing backslash"
+            i += 2
+            continue
+        if c == '[':
+            i += 1
+            if i < n and pattern[i] == '^':
+                i += 1
+            while i < n and pattern[i] != ']':
+                i += 2 if pattern[i] == '\\' else 1
+            if i >= n:
+                return "unterminated character set"
+        elif c == '(':
+            depth += 1
+        elif c == ')':
+            if depth == 0:
+                return "unbalanced parenthesis"
+            depth -= 1
+        i += 1
+    if depth:
+        return "missing ), unterminated subpattern"
+    return None
+
+def _check_regex(pattern: str) -> None:
+    """Reject regex patterns with unbalanced syntax, before they reach the server"""
+    error = _find_regex_syntax_error(pattern)
+    if error is not None:
+        raise ValueError(f"Invalid regex pattern: {pattern} ({error})")
+
+def _make_args_pair(start: Any, end: Any, expected_type: DynamicValueType) -> Tuple[Argument, Argument]:
+    """Build the Arguments of a range operator, checking both plain values against one type lookup"""
+    expected_python_type = _EXPECTED_PY_TYPE[expected_type]
+    if isinstance(start, expected_python_type) and isinstance(end, expected_python_type):
+        return (Argument._unchecked(start, expected_type), Argument._unchecked(end, expected_type))
+    return (_make_argument(start, expected_type), _make_argument(end, expected_type))
+
+# Exact Python types that pass each type check, so a whole list can be vetted in one pass
+_EXACT_PY_TYPES = {
+    t: frozenset(py_type if isinstance(py_type, tuple) else (py_type,))
+    for t, py_type in _EXPECTED_PY_TYPE.items()
+}
+
+_unchecked_argument = Argument._unchecked
+
+def _build_arg_list(values: Any, expected_type: DynamicValueType) -> List[Argument]:
+    """Wrap every element of an iterable in an Argument of the given type"""
+    if type(values) is not list and type(values) is not tuple:
+        values = list(values)  # The elements are walked twice; don't exhaust an iterator
+    if _EXACT_PY_TYPES[expected_type].issuperset(map(type, values)):
+        # Every element is known good, so skip per-Argument validation
+        return list(map(_unchecked_argument, values, repeat(expected_type)))
+    return list(map(Argument, values, repeat(expected_type)))
+
+# Exact types accepted by the bulk numeric path; anything else is re-checked per element
+_NUMBER_TYPES = frozenset((int, float, bool))
+
+def _validate_numbers(values: Any) -> List[Union[int, float]]:
+    """
+    Validate a homogeneous numeric list in one pass and return it as plain numbers.
+
+    Plain numbers serialize exactly like number Arguments, so large lists skip the
+    per-element Argument allocation entirely.
+    """
+    numbers = list(values)
+    if not _NUMBER_TYPES.issuperset(map(type, numbers)):
+        # Re-check element by element for subclasses and to report the offending value
+        _build_arg_list(numbers, _DVT_NUMBER)
+    return numbers
+
+# How Argument.process treats each concrete type: a converter for Argument/DynamicValue,
+# the container type itself for lists and dicts, or None to pass the value through.
+# Types not listed here (e.g. subclasses) are resolved with isinstance once and memoized.
+_PROCESS_DISPATCH: Dict[type, Any] = {
+    Argument: Argument.to_dict,
+    DynamicValue: DynamicValue.to_dict,
+    list: list,
+    dict: dict,
+    str: None,
+    int: None,
+    float: None,
+    bool: None,
+    type(None): None,
+    datetime: None,
+}
+_UNRESOLVED = object()
+
+def _resolve_process_handler(value_type: type) -> Any:
+    """Resolve and memoize the Argument.process handler for a type missing from the table"""
+    if issubclass(value_type, (Argument, DynamicValue)):
+        handler: Any = value_type.to_dict
+    elif issubclass(value_type, list):
+        handler = list
+    elif issubclass(value_type, dict):
+        handler = dict
+    else:
+        handler = None
+    _PROCESS_DISPATCH[value_type] = handler
+    return handler
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _cached_argument(value: Any, expected_type: DynamicValueType) -> Argument:
+    return Argument(value, expected_type)
+
+def _make_argument(value: Any, expected_type: DynamicValueType) -> Argument:
+    """Return a shared Argument for primitives safe to use as a cache key, else a fresh instance"""
+    if type(value) is DynamicValue or not _is_cache_key_safe(value):
+        return Argument(value, expected_type)
+    return _cached_argument(value, expected_type)
+
+@functools.lru_cache(maxsize=256)
+def _cached_string_arg_tuple(values: Tuple[str, ...]) -> Tuple[Argument, ...]:
+    return tuple(_build_arg_list(values, _DVT_STRING))
+
+def _memo_string_arg_list(values: Any) -> List[Argument]:
+    """
+    Wrap a list of strings in Arguments, sharing the Arguments across calls with the same values.
+
+    Only lists made entirely of plain str are memoized; lists holding anything else (dynamic
+    values, str subclasses, values of the wrong type) are built fresh. A new list is returned
+    on every call.
+    """
+    values = tuple(values)
+    if not _EXACT_PY_TYPES[_DVT_STRING].issuperset(map(type, values)):
+        return _build_arg_list(values, _DVT_STRING)
+    return list(_cached_string_arg_tuple(values))
+
+@functools.lru_cache(maxsize=512)
+def _dyn_list_arg(value: DynamicValue) -> Tuple[Argument]:
+    """
+    Check that a dynamic value holds a list and wrap it as an operator's only argument.
+
+    Cached per DynamicValue (by identity), so a shared list variable referenced from many
+    list operators is validated and wrapped once.
+    """
+    if value.value_type != _DVT_LIST:
+        raise TypeMismatchError(value.name, value.value_type.value)
+    return (_make_argument(value, _DVT_LIST),)
+
+def _obj_list_arg(values: Any) -> Tuple[List[Argument]]:
+    """Wrap a literal list as an operator's only argument, one object Argument per element"""
+    values = list(values)  # Accept any iterable, including generators
+    if len(values) == 0:  # Empty lists (e.g. template defaults) need no wrapping
+        return ([],)
+    return (_build_arg_list(values, _DVT_OBJECT),)
+
+# Shared OperatorDef validators
+def _is_non_empty(x: Any) -> bool:
+    return len(x) > 0
+
+def _is_increasing_pair(args: List[Any]) -> bool:
+    return args[0] < args[1]
+
+def _is_positive_first(args: List[Any]) -> bool:
+    return args[0] > 0
+
+# Operator tables are built once at import and shared (read-only) by every field instance
+_BOOLEAN_OPERATORS = MappingProxyType({
+    "any": OperatorDef("any", [], "Match any boolean value", skip_typecheck=True),
+    "is_true": OperatorDef("is true", [], "Check if value is true"),
+    "is_false": OperatorDef("is false", [], "Check if value is false")
+})
+
 class BooleanField(Field):
     """Valid boolean comparisons/operations in Rulebricks"""
     def __init__(self, name: str, description: str = "", default: bool = False):
-            super().__init__(name, description, default)
-            self.operators = {
-                "any": OperatorDef("any", [], "Match any boolean value", skip_typecheck=True),
-                "is_true": OperatorDef("is true", [], "Check if value is true"),
-                "is_false": OperatorDef("is false", [], "Check if value is false")
-            }
+        super().__init__(name, description, default, _BOOLEAN_OPERATORS)
 
     def equals(self, value: Union[bool, DynamicValue]) -> tuple:
         """Check if value equals the given boolean"""
-        op_name = "is true" if value else "is false"
-        return (op_name, [])
+        return _RES_IS_TRUE if value else _RES_IS_FALSE
+
+_NUMBER_OPERATORS = MappingProxyType({
+    "any": OperatorDef("any", [], "Match any numeric value", skip_typecheck=True),
+    "equals": OperatorDef("equals", [OperatorArg("value", "number", "Number that value must equal")]),
+    "does_not_equal": OperatorDef("does not equal", [OperatorArg("value", "number", "Number that value must not equal")]),
+    "greater_than": OperatorDef("greater than", [OperatorArg("bound", "number", "Number that value must be greater than")]),
+    "less_than": OperatorDef("less than", [OperatorArg("bound", "number", "Number that value must be less than")]),
+    "greater_than_or_equal": OperatorDef("greater than or equal to", [OperatorArg("bound", "number", "Number that value must be greater than or equal to")]),
+    "less_than_or_equal": OperatorDef("less than or equal to", [OperatorArg("bound", "number", "Number that value must be less than or equal to")]),
+    "between": OperatorDef(
+        "between",
+        [
+            OperatorArg("start", "number", "Number that value must be greater than or equal to", placeholder="Start"),
+            OperatorArg("end", "number", "Number that value must be less than or equal to", placeholder="End")
+        ],
+        validate=_is_increasing_pair
+    ),
+    "not_between": OperatorDef(
+        "not between",
+        [
+            OperatorArg("start", "number", "Number that value must be less than", placeholder="Start"),
+            OperatorArg("end", "number", "Number that value must be greater than", placeholder="End")
+        ],
+        validate=_is_increasing_pair
+    ),
+    "is_even": OperatorDef("is even", [], "Check if value is even"),
+    "is_odd": OperatorDef("is odd", [], "Check if value is odd"),
+    "is_positive": OperatorDef("is positive", [], "Check if value is greater than zero"),
+    "is_negative": OperatorDef("is negative", [], "Check if value is less than zero"),
+    "is_zero": OperatorDef("is zero", [], "Check if value equals zero"),
+    "is_not_zero": OperatorDef("is not zero", [], "Check if value does not equal zero"),
+    "is_multiple_of": OperatorDef("is a multiple of", [OperatorArg("multiple", "number", "Number that value must be a multiple of")]),
+    "is_not_multiple_of": OperatorDef("is not a multiple of", [OperatorArg("multiple", "number", "Number that value must not be a multiple of")]),
+    "is_power_of": OperatorDef(
+        "is a power of",
+        [OperatorArg("base", "number", "The base number")],
+        validate=_is_positive_first
+    )
+})
+
+# The base is a known-valid constant, so the result is built once without re-validating it
+_RES_IS_A_POWER_OF_TWO = (_OP_IS_A_POWER_OF, (Argument._unchecked(2, _DVT_NUMBER),))
 
 class NumberField(Field):
     """Valid number comparisons/operations in Rulebricks"""
     def __init__(self, name: str, description: str = "", default: Union[int, float] = 0):
-        super().__init__(name, description, default)
-        self.operators = {
-            "any": OperatorDef("any", [], "Match any numeric value", skip_typecheck=True),
-            "equals": OperatorDef("equals", [OperatorArg("value", "number", "Number that value must equal")]),
-            "does_not_equal": OperatorDef("does not equal", [OperatorArg("value", "number", "Number that value must not equal")]),
-            "greater_than": OperatorDef("greater than", [OperatorArg("bound", "number", "Number that value must be greater than")]),
-            "less_than": OperatorDef("less than", [OperatorArg("bound", "number", "Number that value must be less than")]),
-            "greater_than_or_equal": OperatorDef("greater than or equal to", [OperatorArg("bound", "number", "Number that value must be greater than or equal to")]),
-            "less_than_or_equal": OperatorDef("less than or equal to", [OperatorArg("bound", "number", "Number that value must be less than or equal to")]),
-            "between": OperatorDef(
-                "between",
-                [
-                    OperatorArg("start", "number", "Number that value must be greater than or equal to", placeholder="Start"),
-                    OperatorArg("end", "number", "Number that value must be less than or equal to", placeholder="End")
-                ],
-                validate=lambda args: args[0] < args[1]
-            ),
-            "not_between": OperatorDef(
-                "not between",
-                [
-                    OperatorArg("start", "number", "Number that value must be less than", placeholder="Start"),
-                    OperatorArg("end", "number", "Number that value must be greater than", placeholder="End")
-                ],
-                validate=lambda args: args[0] < args[1]
-            ),
-            "is_even": OperatorDef("is even", [], "Check if value is even"),
-            "is_odd": OperatorDef("is odd", [], "Check if value is odd"),
-            "is_positive": OperatorDef("is positive", [], "Check if value is greater than zero"),
-            "is_negative": OperatorDef("is negative", [], "Check if value is less than zero"),
-            "is_zero": OperatorDef("is zero", [], "Check if value equals zero"),
-            "is_not_zero": OperatorDef("is not zero", [], "Check if value does not equal zero"),
-            "is_multiple_of": OperatorDef("is a multiple of", [OperatorArg("multiple", "number", "Number that value must be a multiple of")]),
-            "is_not_multiple_of": OperatorDef("is not a multiple of", [OperatorArg("multiple", "number", "Number that value must not be a multiple of")]),
-            "is_power_of": OperatorDef(
-                "is a power of",
-                [OperatorArg("base", "number", "The base number")],
-                validate=lambda args: args[0] > 0
-            )
-        }
+        super().__init__(name, description, default, _NUMBER_OPERATORS)
 
+    @_rule_spec_cache
     def equals(self, value: Union[int, float, DynamicValue]) -> tuple:
-        return ("equals", [Argument(value, DynamicValueType.NUMBER)])
+        return (_OP_EQUALS, (_make_argument(value, _DVT_NUMBER),))
 
+    @_rule_spec_cache
     def not_equals(self, value: Union[int, float, DynamicValue]) -> tuple:
-        return ("does not equal", [Argument(value, DynamicValueType.NUMBER)])
+        return (_OP_DOES_NOT_EQUAL, (_make_argument(value, _DVT_NUMBER),))
 
+    @_rule_spec_cache
     def greater_than(self, value: Union[int, float, DynamicValue]) -> tuple:
-        return ("greater than", [Argument(value, DynamicValueType.NUMBER)])
+        return (_OP_GREATER_THAN, (_make_argument(value, _DVT_NUMBER),))
 
+    @_rule_spec_cache
     def less_than(self, value: Union[int, float, DynamicValue]) -> tuple:
-        return ("less than", [Argument(value, DynamicValueType.NUMBER)])
+        return (_OP_LESS_THAN, (_make_argument(value, _DVT_NUMBER),))
 
+    @_rule_spec_cache
     def greater_than_or_equal(self, value: Union[int, float, DynamicValue]) -> tuple:
-        return ("greater than or equal to", [Argument(value, DynamicValueType.NUMBER)])
+        return (_OP_GREATER_THAN_OR_EQUAL_TO, (_make_argument(value, _DVT_NUMBER),))
 
+    @_rule_spec_cache
     def less_than_or_equal(self, value: Union[int, float, DynamicValue]) -> tuple:
-        return ("less than or equal to", [Argument(value, DynamicValueType.NUMBER)])
+        return (_OP_LESS_THAN_OR_EQUAL_TO, (_make_argument(value, _DVT_NUMBER),))
 
+    @_rule_spec_cache
     def between(self, start: Union[int, float, DynamicValue], end: Union[int, float, DynamicValue]) -> tuple:
-        start_arg = Argument(start, DynamicValueType.NUMBER)
-        end_arg = Argument(end, DynamicValueType.NUMBER)
+        args = _make_args_pair(start, end, _DVT_NUMBER)
         if not isinstance(start, DynamicValue) and not isinstance(end, DynamicValue):
-            op = self.operators["between"]
-            if op.validate and not op.validate([start, end]):
+            if not start < end:
                 raise ValueError(f"Invalid range for between: start ({start}) must be less than end ({end})")
-        return ("between", [start_arg, end_arg])
+        return (_OP_BETWEEN, args)
 
+    @_rule_spec_cache
     def not_between(self, start: Union[int, float, DynamicValue], end: Union[int, float, DynamicValue]) -> tuple:
-        start_arg = Argument(start, DynamicValueType.NUMBER)
-        end_arg = Argument(end, DynamicValueType.NUMBER)
+        args = _make_args_pair(start, end, _DVT_NUMBER)
         if not isinstance(start, DynamicValue) and not isinstance(end, DynamicValue):
-            op = self.operators["not_between"]
-            if op.validate and not op.validate([start, end]):
+            if not start < end:
                 raise ValueError(f"Invalid range for not between: start ({start}) must be less than end ({end})")
-        return ("not between", [start_arg, end_arg])
+        return (_OP_NOT_BETWEEN, args)
 
     def is_even(self) -> tuple:
-        return ("is even", [])
+        return _RES_IS_EVEN
 
     def is_odd(self) -> tuple:
-        return ("is odd", [])
+        return _RES_IS_ODD
 
     def is_positive(self) -> tuple:
-        return ("is positive", [])
+        return _RES_IS_POSITIVE
 
     def is_negative(self) -> tuple:
-        return ("is negative", [])
+        return _RES_IS_NEGATIVE
 
     def is_zero(self) -> tuple:
-        return ("is zero", [])
+        return _RES_IS_ZERO
 
     def is_not_zero(self) -> tuple:
-        return ("is not zero", [])
+        return _RES_IS_NOT_ZERO
 
+    @_rule_spec_cache
     def is_multiple_of(self, value: Union[int, float, DynamicValue]) -> tuple:
-        return ("is a multiple of", [Argument(value, DynamicValueType.NUMBER)])
+        return (_OP_IS_A_MULTIPLE_OF, (_make_argument(value, _DVT_NUMBER),))
 
+    @_rule_spec_cache
     def is_not_multiple_of(self, value: Union[int, float, DynamicValue]) -> tuple:
-        return ("is not a multiple of", [Argument(value, DynamicValueType.NUMBER)])
+        return (_OP_IS_NOT_A_MULTIPLE_OF, (_make_argument(value, _DVT_NUMBER),))
 
+    @_rule_spec_cache
     def is_power_of(self, base: Union[int, float, DynamicValue]) -> tuple:
         if not isinstance(base, DynamicValue):
-            op = self.operators["is_power_of"]
-            if op.validate and not op.validate([base]):
+            if not base > 0:
                 raise ValueError(f"Invalid base for is power of: {base}. Base must be positive.")
-        return ("is a power of", [Argument(base, DynamicValueType.NUMBER)])
+        return (_OP_IS_A_POWER_OF, (_make_argument(base, _DVT_NUMBER),))
+
+    def is_power_of_two(self) -> tuple:
+        """Check if value is a power of two (shorthand for is_power_of(2))"""
+        return _RES_IS_A_POWER_OF_TWO
+
+_STRING_OPERATORS = MappingProxyType({
+    "any": OperatorDef("any", [], "Match any string value", skip_typecheck=True),
+    "contains": OperatorDef(
+        "contains",
+        [OperatorArg("value", "string", "The value to search for within the string", validate=_is_non_empty)]
+    ),
+    "does_not_contain": OperatorDef(
+        "does not contain",
+        [OperatorArg("value", "string", "The value to search for within the string", validate=_is_non_empty)]
+    ),
+    "equals": OperatorDef("equals", [OperatorArg("value", "string", "The value to compare against")]),
+    "does_not_equal": OperatorDef("does not equal", [OperatorArg("value", "string", "The value to compare against")]),
+    "is_empty": OperatorDef("is empty", [], "Check if string is empty"),
+    "is_not_empty": OperatorDef("is not empty", [], "Check if string is not empty"),
+    "starts_with": OperatorDef(
+        "starts with",
+        [OperatorArg("value", "string", "The value the string should start with", validate=_is_non_empty)]
+    ),
+    "ends_with": OperatorDef(
+        "ends with",
+        [OperatorArg("value", "string", "The value the string should end with", validate=_is_non_empty)]
+    ),
+    "is_included_in": OperatorDef(
+        "is included in",
+        [OperatorArg("value", "list", "A list of values the string should be in", validate=_is_non_empty)]
+    ),
+    "is_not_included_in": OperatorDef(
+        "is not included in",
+        [OperatorArg("value", "list", "A list of values the string should not be in", validate=_is_non_empty)]
+    ),
+    "matches_regex": OperatorDef(
+        "matches RegEx",
+        [OperatorArg("regex", "string", "The regex the string should match", validate=_is_non_empty)]
+    ),
+    "does_not_match_regex": OperatorDef(
+        "does not match RegEx",
+        [OperatorArg("regex", "string", "The regex the string should not match", validate=_is_non_empty)]
+    ),
+    "is_valid_email": OperatorDef("is a valid email address", [], "Check if string is a valid email address"),
+    "is_not_valid_email": OperatorDef("is not a valid email address", [], "Check if string is not a valid email address"),
+    "is_valid_url": OperatorDef("is a valid URL", [], "Check if string is a valid URL"),
+    "is_not_valid_url": OperatorDef("is not a valid URL", [], "Check if string is not a valid URL"),
+    "is_valid_ip": OperatorDef("is a valid IP address", [], "Check if string is a valid IP address"),
+    "is_not_valid_ip": OperatorDef("is not a valid IP address", [], "Check if string is not a valid IP address"),
+    "is_uppercase": OperatorDef("is uppercase", [], "Check if string is all uppercase"),
+    "is_lowercase": OperatorDef("is lowercase", [], "Check if string is all lowercase"),
+    "is_numeric": OperatorDef("is numeric", [], "Check if string contains only numeric characters"),
+    "contains_only_digits": OperatorDef("contains only digits", [], "Check if string contains only digits"),
+    "contains_only_letters": OperatorDef("contains only letters", [], "Check if string contains only letters"),
+    "contains_only_digits_and_letters": OperatorDef(
+        "contains only digits and letters",
+        [],
+        "Check if string contains only digits and letters"
+    )
+})
+
+# Argument validators of the string builders, bound once instead of walked per call
+_VALIDATE_CONTAINS = _STRING_OPERATORS["contains"].args[0].validate
+_VALIDATE_DOES_NOT_CONTAIN = _STRING_OPERATORS["does_not_contain"].args[0].validate
+_VALIDATE_STARTS_WITH = _STRING_OPERATORS["starts_with"].args[0].validate
+_VALIDATE_ENDS_WITH = _STRING_OPERATORS["ends_with"].args[0].validate
+_VALIDATE_IS_INCLUDED_IN = _STRING_OPERATORS["is_included_in"].args[0].validate
+_VALIDATE_MATCHES_REGEX = _STRING_OPERATORS["matches_regex"].args[0].validate
+_VALIDATE_DOES_NOT_MATCH_REGEX = _STRING_OPERATORS["does_not_match_regex"].args[0].validate
 
 class StringField(Field):
     """Valid text comparisons/operations in Rulebricks"""
     def __init__(self, name: str, description: str = "", default: str = ""):
-        super().__init__(name, description, default)
-        self.operators = {
-            "any": OperatorDef("any", [], "Match any string value", skip_typecheck=True),
-            "contains": OperatorDef(
-                "contains",
-                [OperatorArg("value", "string", "The value to search for within the string", validate=lambda x: len(x) > 0)]
-            ),
-            "does_not_contain": OperatorDef(
-                "does not contain",
-                [OperatorArg("value", "string", "The value to search for within the string", validate=lambda x: len(x) > 0)]
-            ),
-            "equals": OperatorDef("equals", [OperatorArg("value", "string", "The value to compare against")]),
-            "does_not_equal": OperatorDef("does not equal", [OperatorArg("value", "string", "The value to compare against")]),
-            "is_empty": OperatorDef("is empty", [], "Check if string is empty"),
-            "is_not_empty": OperatorDef("is not empty", [], "Check if string is not empty"),
-            "starts_with": OperatorDef(
-                "starts with",
-                [OperatorArg("value", "string", "The value the string should start with", validate=lambda v: len(v) > 0)]
-            ),
-            "ends_with": OperatorDef(
-                "ends with",
-                [OperatorArg("value", "string", "The value the string should end with", validate=lambda v: len(v) > 0)]
-            ),
-            "is_included_in": OperatorDef(
-                "is included in",
-                [OperatorArg("value", "list", "A list of values the string should be in", validate=lambda v: len(v) > 0)]
-            ),
-            "is_not_included_in": OperatorDef(
-                "is not included in",
-                [OperatorArg("value", "list", "A list of values the string should not be in", validate=lambda v: len(v) > 0)]
-            ),
-            "matches_regex": OperatorDef(
-                "matches RegEx",
-                [OperatorArg("regex", "string", "The regex the string should match", validate=lambda v: len(v) > 0)]
-            ),
-            "does_not_match_regex": OperatorDef(
-                "does not match RegEx",
-                [OperatorArg("regex", "string", "The regex the string should not match", validate=lambda v: len(v) > 0)]
-            ),
-            "is_valid_email": OperatorDef("is a valid email address", [], "Check if string is a valid email address"),
-            "is_not_valid_email": OperatorDef("is not a valid email address", [], "Check if string is not a valid email address"),
-            "is_valid_url": OperatorDef("is a valid URL", [], "Check if string is a valid URL"),
-            "is_not_valid_url": OperatorDef("is not a valid URL", [], "Check if string is not a valid URL"),
-            "is_valid_ip": OperatorDef("is a valid IP address", [], "Check if string is a valid IP address"),
-            "is_not_valid_ip": OperatorDef("is not a valid IP address", [], "Check if string is not a valid IP address"),
-            "is_uppercase": OperatorDef("is uppercase", [], "Check if string is all uppercase"),
-            "is_lowercase": OperatorDef("is lowercase", [], "Check if string is all lowercase"),
-            "is_numeric": OperatorDef("is numeric", [], "Check if string contains only numeric characters"),
-            "contains_only_digits": OperatorDef("contains only digits", [], "Check if string contains only digits"),
-            "contains_only_letters": OperatorDef("contains only letters", [], "Check if string contains only letters"),
-            "contains_only_digits_and_letters": OperatorDef(
-                "contains only digits and letters",
-                [],
-                "Check if string contains only digits and letters"
-            )
-        }
+        super().__init__(name, description, default, _STRING_OPERATORS)
 
+    @_rule_spec_cache
     def contains(self, value: Union[str, DynamicValue]) -> tuple:
-        arg = Argument(value, DynamicValueType.STRING)
+        arg = _make_argument(value, _DVT_STRING)
         if not isinstance(value, DynamicValue):
-            op = self.operators["contains"]
-            if op.args[0].validate and not op.args[0].validate(value):
+            if not _VALIDATE_CONTAINS(value):
                 raise ValueError(f"Invalid value for contains: {value}")
-        return ("contains", [arg])
+        return (_OP_CONTAINS, (arg,))
 
+    @_rule_spec_cache
     def not_contains(self, value: Union[str, DynamicValue]) -> tuple:
-        arg = Argument(value, DynamicValueType.STRING)
+        arg = _make_argument(value, _DVT_STRING)
         if not isinstance(value, DynamicValue):
-            op = self.operators["does_not_contain"]
-            if op.args[0].validate and not op.args[0].validate(value):
+            if not _VALIDATE_DOES_NOT_CONTAIN(value):
                 raise ValueError(f"Invalid value for does not contain: {value}")
-        return ("does not contain", [arg])
+        return (_OP_DOES_NOT_CONTAIN, (arg,))
 
+    @_rule_spec_cache
     def equals(self, value: Union[str, DynamicValue]) -> tuple:
-        return ("equals", [Argument(value, DynamicValueType.STRING)])
+        return (_OP_EQUALS, (_make_argument(value, _DVT_STRING),))
 
+    @_rule_spec_cache
     def not_equals(self, value: Union[str, DynamicValue]) -> tuple:
-        return ("does not equal", [Argument(value, DynamicValueType.STRING)])
+        return (_OP_DOES_NOT_EQUAL, (_make_argument(value, _DVT_STRING),))
 
     def is_empty(self) -> tuple:
-        return ("is empty", [])
+        return _RES_IS_EMPTY
 
     def is_not_empty(self) -> tuple:
-        return ("is not empty", [])
+        return _RES_IS_NOT_EMPTY
 
+    @_rule_spec_cache
     def starts_with(self, value: Union[str, DynamicValue]) -> tuple:
-        arg = Argument(value, DynamicValueType.STRING)
+        arg = _make_argument(value, _DVT_STRING)
         if not isinstance(value, DynamicValue):
-            op = self.operators["starts_with"]
-            if op.args[0].validate and not op.args[0].validate(value):
+            if not _VALIDATE_STARTS_WITH(value):
                 raise ValueError(f"Invalid value for starts with: {value}")
-        return ("starts with", [arg])
+        return (_OP_STARTS_WITH, (arg,))
 
+    @_rule_spec_cache
     def ends_with(self, value: Union[str, DynamicValue]) -> tuple:
-        arg = Argument(value, DynamicValueType.STRING)
+        arg = _make_argument(value, _DVT_STRING)
         if not isinstance(value, DynamicValue):
-            op = self.operators["ends_with"]
-            if op.args[0].validate and not op.args[0].validate(value):
+            if not _VALIDATE_ENDS_WITH(value):
                 raise ValueError(f"Invalid value for ends with: {value}")
-        return ("ends with", [arg])
+        return (_OP_ENDS_WITH, (arg,))
 
+    @_rule_spec_cache
     def is_included_in(self, values: Union[List[str], List[DynamicValue], DynamicValue]) -> tuple:
         if isinstance(values, DynamicValue):
-            if values.value_type != DynamicValueType.LIST:
-                raise TypeMismatchError(
-                    f"Dynamic value '{values.name}' has type {values.value_type.value}, "
-                    f"but list was expected"
-                )
-            return ("is included in", [Argument(values, DynamicValueType.LIST)])
+            return (_OP_IS_INCLUDED_IN, _dyn_list_arg(values))
 
-        op = self.operators["is_included_in"]
-        if op.args[0].validate and not op.args[0].validate(values):
+        if not _VALIDATE_IS_INCLUDED_IN(values):
             raise ValueError("List must not be empty")
 
-        return ("is included in", [[Argument(v, DynamicValueType.STRING) for v in values]])
+        return (_OP_IS_INCLUDED_IN, (_memo_string_arg_list(values),))
 
+    @_rule_spec_cache
     def matches_regex(self, pattern: Union[str, DynamicValue]) -> tuple:
-        arg = Argument(pattern, DynamicValueType.STRING)
+        arg = _make_argument(pattern, _DVT_STRING)
         if not isinstance(pattern, DynamicValue):
-            op = self.operators["matches_regex"]
-            if op.args[0].validate and not op.args[0].validate(pattern):
+            if not _VALIDATE_MATCHES_REGEX(pattern):
                 raise ValueError(f"Invalid regex pattern: {pattern}")
-        return ("matches RegEx", [arg])
+            _check_regex(pattern)
+        return (_OP_MATCHES_REGEX, (arg,))
 
+    @_rule_spec_cache
     def not_matches_regex(self, pattern: Union[str, DynamicValue]) -> tuple:
-        arg = Argument(pattern, DynamicValueType.STRING)
+        arg = _make_argument(pattern, _DVT_STRING)
         if not isinstance(pattern, DynamicValue):
-            op = self.operators["does_not_match_regex"]
-            if op.args[0].validate and not op.args[0].validate(pattern):
+            if not _VALIDATE_DOES_NOT_MATCH_REGEX(pattern):
                 raise ValueError(f"Invalid regex pattern: {pattern}")
-        return ("does not match RegEx", [arg])
+            _check_regex(pattern)
+        return (_OP_DOES_NOT_MATCH_REGEX, (arg,))
 
     def is_email(self) -> tuple:
-        return ("is a valid email address", [])
+        return _RES_IS_A_VALID_EMAIL_ADDRESS
 
     def is_not_email(self) -> tuple:
-        return ("is not a valid email address", [])
+        return _RES_IS_NOT_A_VALID_EMAIL_ADDRESS
 
     def is_url(self) -> tuple:
-        return ("is a valid URL", [])
+        return _RES_IS_A_VALID_URL
 
     def is_not_url(self) -> tuple:
-        return ("is not a valid URL", [])
+        return _RES_IS_NOT_A_VALID_URL
 
     def is_ip(self) -> tuple:
-        return ("is a valid IP address", [])
+        return _RES_IS_A_VALID_IP_ADDRESS
 
     def is_not_ip(self) -> tuple:
-        return ("is not a valid IP address", [])
+        return _RES_IS_NOT_A_VALID_IP_ADDRESS
 
     def is_uppercase(self) -> tuple:
-        return ("is uppercase", [])
+        return _RES_IS_UPPERCASE
 
     def is_lowercase(self) -> tuple:
-        return ("is lowercase", [])
+        return _RES_IS_LOWERCASE
 
     def is_numeric(self) -> tuple:
-        return ("is numeric", [])
+        return _RES_IS_NUMERIC
 
     def contains_only_digits(self) -> tuple:
-        return ("contains only digits", [])
+        return _RES_CONTAINS_ONLY_DIGITS
 
     def contains_only_letters(self) -> tuple:
-        return ("contains only letters", [])
+        return _RES_CONTAINS_ONLY_LETTERS
 
     def contains_only_digits_and_letters(self) -> tuple:
-        return ("contains only digits and letters", [])
+        return _RES_CONTAINS_ONLY_DIGITS_AND_LETTERS
+
+_DATE_OPERATORS = MappingProxyType({
+    "any": OperatorDef("any", [], "Match any date value", skip_typecheck=True),
+    "is_past": OperatorDef("is in the past", [], "Date is in the past"),
+    "is_future": OperatorDef("is in the future", [], "Date is in the future"),
+    "days_ago": OperatorDef(
+        "days ago",
+        [OperatorArg("days", "number", "Number of days ago that the date is equal to")]
+    ),
+    "less_than_days_ago": OperatorDef(
+        "is less than N days ago",
+        [OperatorArg("days", "number", "Number of days ago that the date is less than or equal to")]
+    ),
+    "more_than_days_ago": OperatorDef(
+        "is more than N days ago",
+        [OperatorArg("days", "number", "Number of days ago that the date is more than or equal to")]
+    ),
+    "days_from_now": OperatorDef(
+        "days from now",
+        [OperatorArg("days", "number", "Number of days from now that the date is equal to")]
+    ),
+    "less_than_days_from_now": OperatorDef(
+        "is less than N days from now",
+        [OperatorArg("days", "number", "Number of days from now that the date is less than or equal to")]
+    ),
+    "more_than_days_from_now": OperatorDef(
+        "is more than N days from now",
+        [OperatorArg("days", "number", "Number of days from now that the date is more than or equal to")]
+    ),
+    "is_today": OperatorDef("is today", [], "Date is today"),
+    "is_this_week": OperatorDef("is this week", [], "Date is in the current week"),
+    "is_this_month": OperatorDef("is this month", [], "Date is in the current month"),
+    "is_this_year": OperatorDef("is this year", [], "Date is in the current year"),
+    "is_next_week": OperatorDef("is next week", [], "Date is in the next week"),
+    "is_next_month": OperatorDef("is next month", [], "Date is in the next month"),
+    "is_next_year": OperatorDef("is next year", [], "Date is in the next year"),
+    "is_last_week": OperatorDef("is last week", [], "Date is in the previous week"),
+    "is_last_month": OperatorDef("is last month", [], "Date is in the previous month"),
+    "is_last_year": OperatorDef("is last year", [], "Date is in the previous year"),
+    "after": OperatorDef(
+        "after",
+        [OperatorArg("date", "date", "Date that value must be after")]
+    ),
+    "on_or_after": OperatorDef(
+        "on or after",
+        [OperatorArg("date", "date", "Date that value must be on or after")]
+    ),
+    "before": OperatorDef(
+        "before",
+        [OperatorArg("date", "date", "Date that value must be before")]
+    ),
+    "on_or_before": OperatorDef(
+        "on or before",
+        [OperatorArg("date", "date", "Date that value must be on or before")]
+    ),
+    "between": OperatorDef(
+        "between",
+        [
+            OperatorArg("start", "date", "Date that value must be after", placeholder="From"),
+            OperatorArg("end", "date", "Date that value must be before", placeholder="To")
+        ]
+    ),
+    "not_between": OperatorDef(
+        "not between",
+        [
+            OperatorArg("start", "date", "Date that value must be before", placeholder="From"),
+            OperatorArg("end", "date", "Date that value must be after", placeholder="To")
+        ]
+    )
+})
 
 class DateField(Field):
     """Valid date comparisons/operations in Rulebricks"""
     def __init__(self, name: str, description: str = "", default: Optional[datetime] = None):
-        super().__init__(name, description, default)
-        self.operators = {
-            "any": OperatorDef("any", [], "Match any date value", skip_typecheck=True),
-            "is_past": OperatorDef("is in the past", [], "Date is in the past"),
-            "is_future": OperatorDef("is in the future", [], "Date is in the future"),
-            "days_ago": OperatorDef(
-                "days ago",
-                [OperatorArg("days", "number", "Number of days ago that the date is equal to")]
-            ),
-            "less_than_days_ago": OperatorDef(
-                "is less than N days ago",
-                [OperatorArg("days", "number", "Number of days ago that the date is less than or equal to")]
-            ),
-            "more_than_days_ago": OperatorDef(
-                "is more than N days ago",
-                [OperatorArg("days", "number", "Number of days ago that the date is more than or equal to")]
-            ),
-            "days_from_now": OperatorDef(
-                "days from now",
-                [OperatorArg("days", "number", "Number of days from now that the date is equal to")]
-            ),
-            "less_than_days_from_now": OperatorDef(
-                "is less than N days from now",
-                [OperatorArg("days", "number", "Number of days from now that the date is less than or equal to")]
-            ),
-            "more_than_days_from_now": OperatorDef(
-                "is more than N days from now",
-                [OperatorArg("days", "number", "Number of days from now that the date is more than or equal to")]
-            ),
-            "is_today": OperatorDef("is today", [], "Date is today"),
-            "is_this_week": OperatorDef("is this week", [], "Date is in the current week"),
-            "is_this_month": OperatorDef("is this month", [], "Date is in the current month"),
-            "is_this_year": OperatorDef("is this year", [], "Date is in the current year"),
-            "is_next_week": OperatorDef("is next week", [], "Date is in the next week"),
-            "is_next_month": OperatorDef("is next month", [], "Date is in the next month"),
-            "is_next_year": OperatorDef("is next year", [], "Date is in the next year"),
-            "is_last_week": OperatorDef("is last week", [], "Date is in the previous week"),
-            "is_last_month": OperatorDef("is last month", [], "Date is in the previous month"),
-            "is_last_year": OperatorDef("is last year", [], "Date is in the previous year"),
-            "after": OperatorDef(
-                "after",
-                [OperatorArg("date", "date", "Date that value must be after")]
-            ),
-            "on_or_after": OperatorDef(
-                "on or after",
-                [OperatorArg("date", "date", "Date that value must be on or after")]
-            ),
-            "before": OperatorDef(
-                "before",
-                [OperatorArg("date", "date", "Date that value must be before")]
-            ),
-            "on_or_before": OperatorDef(
-                "on or before",
-                [OperatorArg("date", "date", "Date that value must be on or before")]
-            ),
-            "between": OperatorDef(
-                "between",
-                [
-                    OperatorArg("start", "date", "Date that value must be after", placeholder="From"),
-                    OperatorArg("end", "date", "Date that value must be before", placeholder="To")
-                ]
-            ),
-            "not_between": OperatorDef(
-                "not between",
-                [
-                    OperatorArg("start", "date", "Date that value must be before", placeholder="From"),
-                    OperatorArg("end", "date", "Date that value must be after", placeholder="To")
-                ]
-            )
-        }
+        super().__init__(name, description, default, _DATE_OPERATORS)
 
     def is_past(self) -> tuple:
-        return ("is in the past", [])
+        return _RES_IS_IN_THE_PAST
 
     def is_future(self) -> tuple:
-        return ("is in the future", [])
+        return _RES_IS_IN_THE_FUTURE
 
+    @_rule_spec_cache
     def days_ago(self, days: Union[int, DynamicValue]) -> tuple:
-        return ("days ago", [Argument(days, DynamicValueType.NUMBER)])
+        return (_OP_DAYS_AGO, (_make_argument(days, _DVT_NUMBER),))
 
+    @_rule_spec_cache
     def less_than_days_ago(self, days: Union[int, DynamicValue]) -> tuple:
-        return ("is less than N days ago", [Argument(days, DynamicValueType.NUMBER)])
+        return (_OP_IS_LESS_THAN_N_DAYS_AGO, (_make_argument(days, _DVT_NUMBER),))
 
+    @_rule_spec_cache
     def more_than_days_ago(self, days: Union[int, DynamicValue]) -> tuple:
-        return ("is more than N days ago", [Argument(days, DynamicValueType.NUMBER)])
+        return (_OP_IS_MORE_THAN_N_DAYS_AGO, (_make_argument(days, _DVT_NUMBER),))
 
+    @_rule_spec_cache
     def days_from_now(self, days: Union[int, DynamicValue]) -> tuple:
-        return ("days from now", [Argument(days, DynamicValueType.NUMBER)])
+        return (_OP_DAYS_FROM_NOW, (_make_argument(days, _DVT_NUMBER),))
 
+    @_rule_spec_cache
     def less_than_days_from_now(self, days: Union[int, DynamicValue]) -> tuple:
-        return ("is less than N days from now", [Argument(days, DynamicValueType.NUMBER)])
+        return (_OP_IS_LESS_THAN_N_DAYS_FROM_NOW, (_make_argument(days, _DVT_NUMBER),))
 
+    @_rule_spec_cache
     def more_than_days_from_now(self, days: Union[int, DynamicValue]) -> tuple:
-        return ("is more than N days from now", [Argument(days, DynamicValueType.NUMBER)])
+        return (_OP_IS_MORE_THAN_N_DAYS_FROM_NOW, (_make_argument(days, _DVT_NUMBER),))
 
     def is_today(self) -> tuple:
-        return ("is today", [])
+        return _RES_IS_TODAY
 
     def is_this_week(self) -> tuple:
-        return ("is this week", [])
+        return _RES_IS_THIS_WEEK
 
     def is_this_month(self) -> tuple:
-        return ("is this month", [])
+        return _RES_IS_THIS_MONTH
 
     def is_this_year(self) -> tuple:
-        return ("is this year", [])
+        return _RES_IS_THIS_YEAR
 
     def is_next_week(self) -> tuple:
-        return ("is next week", [])
+        return _RES_IS_NEXT_WEEK
 
     def is_next_month(self) -> tuple:
-        return ("is next month", [])
+        return _RES_IS_NEXT_MONTH
 
     def is_next_year(self) -> tuple:
-        return ("is next year", [])
+        return _RES_IS_NEXT_YEAR
 
     def is_last_week(self) -> tuple:
-        return ("is last week", [])
+        return _RES_IS_LAST_WEEK
 
     def is_last_month(self) -> tuple:
-        return ("is last month", [])
+        return _RES_IS_LAST_MONTH
 
     def is_last_year(self) -> tuple:
-        return ("is last year", [])
+        return _RES_IS_LAST_YEAR
 
+    @_rule_spec_cache
     def after(self, date: Union[datetime, str, DynamicValue]) -> tuple:
-        return ("after", [Argument(date, DynamicValueType.DATE)])
+        return (_OP_AFTER, (_make_argument(date, _DVT_DATE),))
 
+    @_rule_spec_cache
     def on_or_after(self, date: Union[datetime, str, DynamicValue]) -> tuple:
-        return ("on or after", [Argument(date, DynamicValueType.DATE)])
+        return (_OP_ON_OR_AFTER, (_make_argument(date, _DVT_DATE),))
 
+    @_rule_spec_cache
     def before(self, date: Union[datetime, str, DynamicValue]) -> tuple:
-        return ("before", [Argument(date, DynamicValueType.DATE)])
+        return (_OP_BEFORE, (_make_argument(date, _DVT_DATE),))
 
+    @_rule_spec_cache
     def on_or_before(self, date: Union[datetime, str, DynamicValue]) -> tuple:
-        return ("on or before", [Argument(date, DynamicValueType.DATE)])
+        return (_OP_ON_OR_BEFORE, (_make_argument(date, _DVT_DATE),))
 
+    @_rule_spec_cache
     def between(self, start: Union[datetime, str, DynamicValue], end: Union[datetime, str, DynamicValue]) -> tuple:
-        return ("between", [Argument(start, DynamicValueType.DATE), Argument(end, DynamicValueType.DATE)])
+        return (_OP_BETWEEN, _make_args_pair(start, end, _DVT_DATE))
 
+    @_rule_spec_cache
     def not_between(self, start: Union[datetime, str, DynamicValue], end: Union[datetime, str, DynamicValue]) -> tuple:
-        return ("not between", [Argument(start, DynamicValueType.DATE), Argument(end, DynamicValueType.DATE)])
+        return (_OP_NOT_BETWEEN, _make_args_pair(start, end, _DVT_DATE))
+
+_LIST_OPERATORS = MappingProxyType({
+    "any": OperatorDef("any", [], "Match any list value", skip_typecheck=True),
+    "contains": OperatorDef(
+        "contains",
+        [OperatorArg("value", "generic", "Value that must be contained in the list")]
+    ),
+    "is_empty": OperatorDef("is empty", [], "Check if list is empty"),
+    "is_not_empty": OperatorDef("is not empty", [], "Check if list is not empty"),
+    "is_of_length": OperatorDef(
+        "is of length",
+        [OperatorArg("length", "number", "Length that the list must be")]
+    ),
+    "is_not_of_length": OperatorDef(
+        "is not of length",
+        [OperatorArg("length", "number", "Length that the list must not be")]
+    ),
+    "is_longer_than": OperatorDef(
+        "is longer than",
+        [OperatorArg("length", "number", "Length that the list must be longer than")]
+    ),
+    "is_shorter_than": OperatorDef(
+        "is shorter than",
+        [OperatorArg("length", "number", "Length that the list must be shorter than")]
+    ),
+    "contains_all_of": OperatorDef(
+        "contains all of",
+        [OperatorArg("values", "list", "List of values that must be contained in the list")]
+    ),
+    "contains_any_of": OperatorDef(
+        "contains any of",
+        [OperatorArg("values", "list", "List of values that might be contained in the list")]
+    ),
+    "contains_none_of": OperatorDef(
+        "contains none of",
+        [OperatorArg("values", "list", "List of values that must not be contained in the list")]
+    ),
+    "does_not_contain": OperatorDef(
+        "does not contain",
+        [OperatorArg("value", "generic", "Value that must not be contained in the list")]
+    ),
+    "is_equal_to": OperatorDef(
+        "is equal to",
+        [OperatorArg("list", "list", "Value that the list must be equal to")]
+    ),
+    "is_not_equal_to": OperatorDef(
+        "is not equal to",
+        [OperatorArg("list", "list", "Value that the list must not be equal to")]
+    ),
+    "contains_duplicates": OperatorDef("contains duplicates", [], "Check if list contains duplicate values"),
+    "does_not_contain_duplicates": OperatorDef("does not contain duplicates", [], "Check if list does not contain duplicate values"),
+    "contains_object_with_key_value": OperatorDef(
+        "contains object with key & value",
+        [
+            OperatorArg("key", "string", "Key of any object contained in the list"),
+            OperatorArg("value", "generic", "Value that the key must be equal to")
+        ]
+    )
+})
+
+def _list_operand(values: Union[List[Any], DynamicValue]) -> tuple:
+    """Wrap a literal list or a list-typed DynamicValue as a list operator's only argument"""
+    return _dyn_list_arg(values) if isinstance(values, DynamicValue) else _obj_list_arg(values)
+
+def _list_operator(name: str, op_name: str) -> Callable[..., tuple]:
+    """Build a ListField builder taking either a literal list or a list-typed DynamicValue"""
+    def method(self, values: Union[List[Any], DynamicValue]) -> tuple:
+        return (op_name, _list_operand(values))
+    method.__name__ = name
+    method.__qualname__ = f"ListField.{name}"
+    return _rule_spec_cache(method)
+
+# Immutable default shared by every ListField created without one; serializes like an empty list
+_EMPTY_LIST_DEFAULT = ()
 
 class ListField(Field):
     """Valid list comparisons/operations in Rulebricks"""
     def __init__(self, name: str, description: str = "", default: Optional[List] = None):
-        super().__init__(name, description, default or [])
-        self.operators = {
-            "any": OperatorDef("any", [], "Match any list value", skip_typecheck=True),
-            "contains": OperatorDef(
-                "contains",
-                [OperatorArg("value", "generic", "Value that must be contained in the list")]
-            ),
-            "is_empty": OperatorDef("is empty", [], "Check if list is empty"),
-            "is_not_empty": OperatorDef("is not empty", [], "Check if list is not empty"),
-            "is_of_length": OperatorDef(
-                "is of length",
-                [OperatorArg("length", "number", "Length that the list must be")]
-            ),
-            "is_not_of_length": OperatorDef(
-                "is not of length",
-                [OperatorArg("length", "number", "Length that the list must not be")]
-            ),
-            "is_longer_than": OperatorDef(
-                "is longer than",
-                [OperatorArg("length", "number", "Length that the list must be longer than")]
-            ),
-            "is_shorter_than": OperatorDef(
-                "is shorter than",
-                [OperatorArg("length", "number", "Length that the list must be shorter than")]
-            ),
-            "contains_all_of": OperatorDef(
-                "contains all of",
-                [OperatorArg("values", "list", "List of values that must be contained in the list")]
-            ),
-            "contains_any_of": OperatorDef(
-                "contains any of",
-                [OperatorArg("values", "list", "List of values that might be contained in the list")]
-            ),
-            "contains_none_of": OperatorDef(
-                "contains none of",
-                [OperatorArg("values", "list", "List of values that must not be contained in the list")]
-            ),
-            "does_not_contain": OperatorDef(
-                "does not contain",
-                [OperatorArg("value", "generic", "Value that must not be contained in the list")]
-            ),
-            "is_equal_to": OperatorDef(
-                "is equal to",
-                [OperatorArg("list", "list", "Value that the list must be equal to")]
-            ),
-            "is_not_equal_to": OperatorDef(
-                "is not equal to",
-                [OperatorArg("list", "list", "Value that the list must not be equal to")]
-            ),
-            "contains_duplicates": OperatorDef("contains duplicates", [], "Check if list contains duplicate values"),
-            "does_not_contain_duplicates": OperatorDef("does not contain duplicates", [], "Check if list does not contain duplicate values"),
-            "contains_object_with_key_value": OperatorDef(
-                "contains object with key & value",
-                [
-                    OperatorArg("key", "string", "Key of any object contained in the list"),
-                    OperatorArg("value", "generic", "Value that the key must be equal to")
-                ]
-            )
-        }
+        super().__init__(name, description, _EMPTY_LIST_DEFAULT if default is None else default, _LIST_OPERATORS)
 
+    @_rule_spec_cache
     def contains(self, value: Union[Any, DynamicValue]) -> tuple:
-        return ("contains", [Argument(value, DynamicValueType.OBJECT)])  # Use OBJECT type for generic values
+        return (_OP_CONTAINS, (_make_argument(value, _DVT_OBJECT),))  # Use OBJECT type for generic values
 
     def is_empty(self) -> tuple:
-        return ("is empty", [])
+        return _RES_IS_EMPTY
 
     def is_not_empty(self) -> tuple:
-        return ("is not empty", [])
+        return _RES_IS_NOT_EMPTY
 
+    @_rule_spec_cache
     def length_equals(self, length: Union[int, DynamicValue]) -> tuple:
-        return ("is of length", [Argument(length, DynamicValueType.NUMBER)])
+        return (_OP_IS_OF_LENGTH, (_make_argument(length, _DVT_NUMBER),))
 
+    @_rule_spec_cache
     def length_not_equals(self, length: Union[int, DynamicValue]) -> tuple:
-        return ("is not of length", [Argument(length, DynamicValueType.NUMBER)])
+        return (_OP_IS_NOT_OF_LENGTH, (_make_argument(length, _DVT_NUMBER),))
 
+    @_rule_spec_cache
     def longer_than(self, length: Union[int, DynamicValue]) -> tuple:
-        return ("is longer than", [Argument(length, DynamicValueType.NUMBER)])
+        return (_OP_IS_LONGER_THAN, (_make_argument(length, _DVT_NUMBER),))
 
+    @_rule_spec_cache
     def shorter_than(self, length: Union[int, DynamicValue]) -> tuple:
-        return ("is shorter than", [Argument(length, DynamicValueType.NUMBER)])
+        return (_OP_IS_SHORTER_THAN, (_make_argument(length, _DVT_NUMBER),))
 
-    def contains_all(self, values: Union[List[Any], DynamicValue]) -> tuple:
-        if isinstance(values, DynamicValue):
-            if values.value_type != DynamicValueType.LIST:
-                raise TypeMismatchError(f"Dynamic value '{values.name}' has type {values.value_type.value}, but list was expected")
-            return ("contains all of", [Argument(values, DynamicValueType.LIST)])
-        return ("contains all of", [[Argument(v, DynamicValueType.OBJECT) for v in values]])
+    contains_all = _list_operator("contains_all", _OP_CONTAINS_ALL_OF)
+    contains_any = _list_operator("contains_any", _OP_CONTAINS_ANY_OF)
+    contains_none = _list_operator("contains_none", _OP_CONTAINS_NONE_OF)
 
-    def contains_any(self, values: Union[List[Any], DynamicValue]) -> tuple:
-        if isinstance(values, DynamicValue):
-            if values.value_type != DynamicValueType.LIST:
-                raise TypeMismatchError(f"Dynamic value '{values.name}' has type {values.value_type.value}, but list was expected")
-            return ("contains any of", [Argument(values, DynamicValueType.LIST)])
-        return ("contains any of", [[Argument(v, DynamicValueType.OBJECT) for v in values]])
+    def contains_all_numeric(self, values: List[Union[int, float]]) -> tuple:
+        """Check if list contains all of the given numbers, validating them in bulk"""
+        return (_OP_CONTAINS_ALL_OF, (_validate_numbers(values),))
 
-    def contains_none(self, values: Union[List[Any], DynamicValue]) -> tuple:
-        if isinstance(values, DynamicValue):
-            if values.value_type != DynamicValueType.LIST:
-                raise TypeMismatchError(f"Dynamic value '{values.name}' has type {values.value_type.value}, but list was expected")
-            return ("contains none of", [Argument(values, DynamicValueType.LIST)])
-        return ("contains none of", [[Argument(v, DynamicValueType.OBJECT) for v in values]])
+    def contains_any_numeric(self, values: List[Union[int, float]]) -> tuple:
+        """Check if list contains any of the given numbers, validating them in bulk"""
+        return (_OP_CONTAINS_ANY_OF, (_validate_numbers(values),))
 
+    @_rule_spec_cache
     def not_contains(self, value: Union[Any, DynamicValue]) -> tuple:
         """Check if list does not contain value"""
-        return ("does not contain", [Argument(value, DynamicValueType.OBJECT)])
+        return (_OP_DOES_NOT_CONTAIN, (_make_argument(value, _DVT_OBJECT),))
 
+    @_rule_spec_cache
     def equals(self, other: Union[List[Any], DynamicValue]) -> tuple:
         """Check if list equals another list"""
-        if isinstance(other, DynamicValue):
-            if other.value_type != DynamicValueType.LIST:
-                raise TypeMismatchError(f"Dynamic value '{other.name}' has type {other.value_type.value}, but list was expected")
-            return ("is equal to", [Argument(other, DynamicValueType.LIST)])
-        return ("is equal to", [[Argument(v, DynamicValueType.OBJECT) for v in other]])
+        return (_OP_IS_EQUAL_TO, _list_operand(other))
 
+    @_rule_spec_cache
     def not_equals(self, other: Union[List[Any], DynamicValue]) -> tuple:
         """Check if list does not equal another list"""
-        if isinstance(other, DynamicValue):
-            if other.value_type != DynamicValueType.LIST:
-                raise TypeMismatchError(f"Dynamic value '{other.name}' has type {other.value_type.value}, but list was expected")
-            return ("is not equal to", [Argument(other, DynamicValueType.LIST)])
-        return ("is not equal to", [[Argument(v, DynamicValueType.OBJECT) for v in other]])
+        return (_OP_IS_NOT_EQUAL_TO, _list_operand(other))
 
     def has_duplicates(self) -> tuple:
         """Check if list has duplicate values"""
-        return ("contains duplicates", [])
+        return _RES_CONTAINS_DUPLICATES
 
     def no_duplicates(self) -> tuple:
         """Check if list has no duplicate values"""
-        return ("does not contain duplicates", [])
+        return _RES_DOES_NOT_CONTAIN_DUPLICATES
 
+    @_rule_spec_cache
     def contains_object_with_key_value(self, key: Union[str, DynamicValue], value: Union[Any, DynamicValue]) -> tuple:
         """Check if list contains an object with specified key and value"""
-        return ("contains object with key & value", [
-            Argument(key, DynamicValueType.STRING),
-            Argument(value, DynamicValueType.OBJECT)
-        ])
+        return (_OP_CONTAINS_OBJECT_WITH_KEY_VALUE, (
+            _make_argument(key, _DVT_STRING),
+            _make_argument(value, _DVT_OBJECT)
+        ))
 
     def has_unique_elements(self) -> tuple:
         """Check if all elements in the list are unique"""
-        return ("has unique elements", [])
+        return _RES_HAS_UNIQUE_ELEMENTS
 
+    @_rule_spec_cache
     def is_sublist_of(self, superlist: Union[List[Any], DynamicValue]) -> tuple:
         """Check if list is a sublist of another list"""
-        if isinstance(superlist, DynamicValue):
-            if superlist.value_type != DynamicValueType.LIST:
-                raise TypeMismatchError(f"Dynamic value '{superlist.name}' has type {superlist.value_type.value}, but list was expected")
-            return ("is a sublist of", [Argument(superlist, DynamicValueType.LIST)])
-        return ("is a sublist of", [[Argument(v, DynamicValueType.OBJECT) for v in superlist]])
+        return (_OP_IS_A_SUBLIST_OF, _list_operand(superlist))
 
+    @_rule_spec_cache
     def is_superlist_of(self, sublist: Union[List[Any], DynamicValue]) -> tuple:
         """Check if list contains another list as a sublist"""
-        if isinstance(sublist, DynamicValue):
-            if sublist.value_type != DynamicValueType.LIST:
-                raise TypeMismatchError(f"Dynamic value '{sublist.name}' has type {sublist.value_type.value}, but list was expected")
-            return ("is a superlist of", [Argument(sublist, DynamicValueType.LIST)])
-        return ("is a superlist of", [[Argument(v, DynamicValueType.OBJECT) for v in sublist]])
+        return (_OP_IS_A_SUPERLIST_OF, _list_operand(sublist))
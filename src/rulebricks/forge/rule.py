@@ -1,23 +1,103 @@
 from .types.operators import RuleType
-from .operators import BooleanField, NumberField, StringField, DateField, ListField, Argument
+from .operators import BooleanField, NumberField, StringField, DateField, ListField, Argument, _EMPTY_LIST_DEFAULT
 from .values import DynamicValue
-from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
-from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union, TYPE_CHECKING
+from datetime import datetime, timezone
+import functools
 import json
 import uuid
 import string
-import random
 import os
 import re
+import secrets
+import time
 
 if TYPE_CHECKING:
     from ..client import RulebricksApi
 
+# Schema type of each field class, used when serializing request/response schemas
+_FIELD_TYPE_MAP = {
+    BooleanField: RuleType.BOOLEAN,
+    NumberField: RuleType.NUMBER,
+    StringField: RuleType.STRING,
+    DateField: RuleType.DATE,
+    ListField: RuleType.LIST
+}
+
+# Translation from random bytes to letters and digits. Bytes at or above the last whole multiple
+# of 62 are deleted rather than wrapped around, so every character stays equally likely.
+_ALNUM_BYTES = (string.ascii_letters + string.digits).encode()
+_ALNUM_TABLE = bytes(_ALNUM_BYTES[b % len(_ALNUM_BYTES)] for b in range(256))
+_ALNUM_REJECT = bytes(range(256 - 256 % len(_ALNUM_BYTES), 256))
+
+def _random_alnum(length: int) -> str:
+    """Generate a random string of ASCII letters and digits from the OS random source"""
+    chars = b""
+    while len(chars) < length:
+        chars += secrets.token_bytes(length + 8).translate(_ALNUM_TABLE, _ALNUM_REJECT)
+    return chars[:length].decode()
+
+# Characters replaced with '_' in exported file names (including spaces)
+_FILENAME_UNSAFE_RE = re.compile(r'[^\w\-.]')
+
+# Valid rule aliases: at least 3 ASCII letters, digits or hyphens
+_ALIAS_RE = re.compile(r'[A-Za-z0-9-]{3,}')
+
+# Seconds a workspace listing (folders, rule slugs, user groups) is reused before being refetched
+_WORKSPACE_CACHE_TTL = 30.0
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 timestamp with microseconds and a 'Z' suffix"""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+@functools.lru_cache(maxsize=4096)
+def _display_name(name: str) -> str:
+    """Human-readable schema name for a field name, e.g. 'annual_income' -> 'Annual Income'"""
+    return name.replace('_', ' ').title()
+
+@functools.lru_cache(maxsize=4096)
+def _split_path(name: str) -> Tuple[Tuple[str, ...], str]:
+    """Split a dotted field name into its parent keys and leaf key, e.g. 'a.b.c' -> (('a', 'b'), 'c')"""
+    *parents, leaf = name.split('.')
+    return tuple(parents), leaf
+
+def _export_default(field: Any) -> Any:
+    """A field's default as written by to_dict; the shared empty ListField default becomes a list"""
+    default = field.default
+    return [] if default is _EMPTY_LIST_DEFAULT else default
+
+def _build_sample(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Nest field defaults into a sample payload following their dotted names"""
+    sample: Dict[str, Any] = {}
+    for name, field in fields.items():
+        parents, leaf = _split_path(name)
+        current = sample
+        for part in parents:
+            current = current.setdefault(part, {})
+        current[leaf] = _export_default(field)
+    return sample
+
+# Settings of a new condition; "schedule" only reserves the key's position and is replaced
+# by a fresh list unless the caller supplies one
+_DEFAULT_CONDITION_SETTINGS = {"enabled": True, "groupId": None, "priority": 0, "schedule": None}
+
+# Argument types that process_dynamic_values returns unchanged without dispatching
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+_tabulate: Any = None
+
+def _get_tabulate() -> Any:
+    """Import tabulate on first use (only the to_table methods need it) and keep the binding"""
+    global _tabulate
+    if _tabulate is None:
+        from tabulate import tabulate as _tabulate
+    return _tabulate
+
 def process_dynamic_values(arg: Any) -> Any:
     """
     Process any argument into the correct format for conditions.
 
-    This function recursively processes arguments to handle DynamicValue instances,
+    This function processes (possibly nested) arguments to handle DynamicValue instances,
     Argument instances, lists, and dictionaries, converting them into the appropriate
     format for use in rule conditions.
 
@@ -33,15 +113,19 @@ def process_dynamic_values(arg: Any) -> Any:
               - For dictionaries: Returns a dict with all values processed
               - For other types: Returns the original value unchanged
     """
-    if isinstance(arg, DynamicValue):
-        return arg.to_dict()
-    elif isinstance(arg, Argument):
-        return arg.value if not isinstance(arg.value, DynamicValue) else arg.value.to_dict()
-    elif isinstance(arg, list):
-        return [process_dynamic_values(item) for item in arg]
-    elif isinstance(arg, dict):
-        return {k: process_dynamic_values(v) for k, v in arg.items()}
-    return arg
+    # Plain scalars, the bulk of condition arguments, need no conversion at all
+    if type(arg) in _SCALAR_TYPES:
+        return arg
+    # Argument.process implements exactly these conversions as an iterative, type-dispatched
+    # walk; it does not use the expected type, so none is passed.
+    return Argument.process(arg, None)
+
+def _process_args(args: Any) -> List[Any]:
+    """Process a condition's arguments, copying them as they are when all are plain scalars"""
+    processed = list(args)
+    if _SCALAR_TYPES.issuperset(map(type, processed)):
+        return processed
+    return [process_dynamic_values(arg) for arg in processed]
 
 class Condition:
     """
@@ -59,6 +143,8 @@ class Condition:
         settings (Dict): Condition settings including enabled state, group ID, priority, and schedule.
     """
 
+    __slots__ = ('rule', 'conditions', 'index', 'responses', 'settings')
+
     def __init__(
             self,
             rule: 'Rule',
@@ -80,9 +166,9 @@ class Condition:
         self.conditions = conditions if conditions is not None else {}
         self.index = index  # None for new conditions, index for editing existing
         self.responses = {}
-        self.settings = {"enabled": True, "groupId": None, "priority": 0, "schedule": []}
-        if settings is not None:
-            self.settings.update(settings)
+        self.settings = {**_DEFAULT_CONDITION_SETTINGS, **settings} if settings else {**_DEFAULT_CONDITION_SETTINGS}
+        if not settings or "schedule" not in settings:
+            self.settings["schedule"] = []
 
     def when(self, **conditions) -> 'Condition':
         """
@@ -101,15 +187,20 @@ class Condition:
         Example:
             >>> condition.when(age=('greater_than', [18]))
         """
-        for field_name, (operator, args) in conditions.items():
-            if field_name not in self.rule.request_fields:
-                raise ValueError(f"Field '{field_name}' is not defined in request schema")
-            if self.index is not None:  # Editing existing condition
-                self.rule.conditions[self.index]["request"][field_name] = {
+        rule = self.rule
+        unknown = conditions.keys() - rule.request_fields.keys()
+        if unknown:
+            field_name = next(name for name in conditions if name in unknown)
+            raise ValueError(f"Field '{field_name}' is not defined in request schema")
+        if self.index is not None:  # Editing existing condition
+            condition_request = rule.conditions[self.index]["request"]
+            for field_name, (operator, args) in conditions.items():
+                condition_request[field_name] = {
                     "op": operator,
-                    "args": [process_dynamic_values(arg) for arg in args]
+                    "args": _process_args(args)
                 }
-            else:  # Creating new condition
+        else:  # Creating new condition
+            for field_name, (operator, args) in conditions.items():
                 self.conditions[field_name] = (operator, args)
         return self
 
@@ -131,13 +222,16 @@ class Condition:
         Example:
             >>> condition.then(approved=True, message="Access granted")
         """
-        for field_name, value in responses.items():
-            if field_name not in self.rule.response_fields:
-                raise ValueError(f"Field '{field_name}' is not defined in response schema")
+        rule = self.rule
+        unknown = responses.keys() - rule.response_fields.keys()
+        if unknown:
+            field_name = next(name for name in responses if name in unknown)
+            raise ValueError(f"Field '{field_name}' is not defined in response schema")
 
         if self.index is not None:  # Editing existing condition
+            condition_response = rule.conditions[self.index]["response"]
             for field_name, value in responses.items():
-                self.rule.conditions[self.index]["response"][field_name] = {
+                condition_response[field_name] = {
                     "value": process_dynamic_values(value)
                 }
             return self
@@ -145,26 +239,24 @@ class Condition:
         else:  # Creating new condition
             self.responses = responses
             condition = {
-                "request": {},
-                "response": {},
+                # Process conditions
+                "request": {
+                    field_name: {
+                        "op": operator,
+                        "args": _process_args(args)
+                    }
+                    for field_name, (operator, args) in self.conditions.items()
+                },
+                # Process responses
+                "response": {
+                    field_name: {"value": process_dynamic_values(value)}
+                    for field_name, value in responses.items()
+                },
                 "settings": self.settings
             }
 
-            # Process conditions
-            for field_name, (operator, args) in self.conditions.items():
-                condition["request"][field_name] = {
-                    "op": operator,
-                    "args": [process_dynamic_values(arg) for arg in args]
-                }
-
-            # Process responses
-            for field_name, value in self.responses.items():
-                condition["response"][field_name] = {
-                    "value": process_dynamic_values(value)
-                }
-
-            self.rule.conditions.append(condition)
-            return self.rule
+            rule.conditions.append(condition)
+            return rule
 
     def set_priority(self, priority: int) -> 'Condition':
         """
@@ -233,10 +325,12 @@ class Condition:
         Returns:
             str: A formatted string containing the condition's fields and values in a grid layout.
         """
-        from tabulate import tabulate
+        tabulate = _get_tabulate()
 
         # Get all field names for headers
-        headers = list(self.rule.request_fields.keys()) + list(self.rule.response_fields.keys())
+        request_keys = list(self.rule.request_fields)
+        response_keys = list(self.rule.response_fields)
+        headers = request_keys + response_keys
         table_data = []
 
         condition = None
@@ -251,17 +345,17 @@ class Condition:
         row = []
 
         # Add request field values
-        for field_name in self.rule.request_fields.keys():
+        for field_name in request_keys:
             if field_name in condition["request"]:
                 rule = condition["request"][field_name]
                 op_name = rule["op"]
-                args_str = ", ".join(map(str, rule["args"]))
+                args_str = ", ".join([str(arg) for arg in rule["args"]])
                 row.append(f"{op_name}\n({args_str})")
             else:
                 row.append("-")
 
         # Add response field values
-        for field_name in self.rule.response_fields.keys():
+        for field_name in response_keys:
             if field_name in condition["response"]:
                 row.append(condition["response"][field_name]["value"])
             else:
@@ -290,6 +384,9 @@ class RuleTest:
         success (Optional[bool]): Whether the test passed or failed.
     """
 
+    __slots__ = ('id', 'name', 'request', 'response', 'critical', 'last_executed', 'test_state',
+                 'error', 'success')
+
     def __init__(self):
         """Initialize a new RuleTest instance with default values."""
         self.id = self._generate_id()
@@ -309,7 +406,7 @@ class RuleTest:
         Returns:
             str: A 21-character random string of letters and numbers.
         """
-        return ''.join(random.choices(string.ascii_letters + string.digits, k=21))
+        return _random_alnum(21)
 
     def set_name(self, name: str) -> 'RuleTest':
         """
@@ -386,23 +483,30 @@ class RuleTest:
         Raises:
             ValueError: If the JSON data is invalid or missing required fields.
         """
-        # Convert string to dict if necessary
-        if isinstance(json_str, str):
-            try:
-                data = json.loads(json_str)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON string: {e}")
-        else:
+        # Convert string to dict if necessary; plain dicts, the common case, need no checks
+        if type(json_str) is dict:
             data = json_str
+        else:
+            if isinstance(json_str, str):
+                try:
+                    data = json.loads(json_str)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Invalid JSON string: {e}")
+            else:
+                data = json_str
 
-        if not isinstance(data, dict):
-            raise ValueError("Input must be a dictionary or JSON object")
+            if not isinstance(data, dict):
+                raise ValueError("Input must be a dictionary or JSON object")
 
-        # Create new rule instance
+        return cls._from_dict(data)
+
+    @classmethod
+    def _from_dict(cls, data: Dict[str, Any]) -> 'RuleTest':
+        """Create a RuleTest instance from an already decoded and validated test dictionary"""
         test = cls()
 
-        # Set basic attributes
-        test.id = data.get('id', test._generate_id())
+        # Set basic attributes, falling back to the id the constructor generated
+        test.id = data.get('id', test.id)
         test.name = data.get('name', 'Untitled Test')
         test.request = data.get('request', {})
         test.response = data.get('response', {})
@@ -466,7 +570,7 @@ class Rule:
         self.name = "Untitled Rule"
         self.description = ""
         self.id = str(uuid.uuid4())
-        self.created_at = datetime.utcnow().isoformat() + "Z"
+        self.created_at = _now_iso()
         self.updated_at = self.created_at
         self.updated_by = "Rulebricks Forge SDK"
         self.slug = self._generate_slug()
@@ -482,6 +586,8 @@ class Rule:
         self.published_request_schema = []
         self.published_response_schema = []
         self.published_groups = {}
+        # Workspace listings by name, as (expiry time, listing); see refresh_workspace_cache()
+        self._workspace_cache: Dict[str, Tuple[float, Any]] = {}
 
     def set_workspace(self, rulebricks_client: Any) -> None:
         """
@@ -494,8 +600,54 @@ class Rule:
             None
         """
         self.workspace = rulebricks_client
+        self.refresh_workspace_cache()
         return
 
+    def refresh_workspace_cache(self) -> 'Rule':
+        """
+        Discard the folder, rule and user group listings cached from the workspace.
+
+        set_folder, set_alias and add_access_group reuse each listing for up to
+        _WORKSPACE_CACHE_TTL seconds before fetching it again; call this if the workspace
+        has been changed elsewhere since.
+
+        Returns:
+            Rule: The current rule instance for method chaining.
+        """
+        self._workspace_cache = {}
+        return self
+
+    def _cached_listing(self, name: str, fetch: Callable[[], Any]) -> Any:
+        """Get a workspace listing, fetching it on first use and again once it has expired"""
+        now = time.monotonic()
+        entry = self._workspace_cache.get(name)
+        if entry is None or now >= entry[0]:
+            entry = self._workspace_cache[name] = (now + _WORKSPACE_CACHE_TTL, fetch())
+        return entry[1]
+
+    def _get_folders(self) -> Dict[str, Any]:
+        """Get the workspace's folders by name"""
+        def fetch() -> Dict[str, Any]:
+            folders: Dict[str, Any] = {}
+            for folder in self.workspace.assets.list_folders():  # type: ignore
+                folders.setdefault(folder.name, folder)
+            return folders
+        return self._cached_listing('folders', fetch)
+
+    def _get_rule_slugs(self) -> set:
+        """Get the slugs of the workspace's rules"""
+        return self._cached_listing(
+            'rule_slugs', lambda: {r.slug for r in self.workspace.assets.list_rules()})  # type: ignore
+
+    def _get_groups(self) -> Dict[str, Any]:
+        """Get the workspace's user groups by name"""
+        def fetch() -> Dict[str, Any]:
+            groups: Dict[str, Any] = {}
+            for group in self.workspace.users.list_groups():  # type: ignore
+                groups.setdefault(group.name, group)
+            return groups
+        return self._cached_listing('groups', fetch)
+
     def __repr__(self) -> str:
         """
         Get a string representation of this rule.
@@ -523,27 +675,30 @@ class Rule:
         Example:
             >>> rule = Rule.from_json('{"name": "My Rule", "conditions": []}')
         """
-        # Convert string to dict if necessary
-        if isinstance(json_str, str):
-            try:
-                data = json.loads(json_str)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON string: {e}")
-        else:
+        # Convert string to dict if necessary; plain dicts, the common case, need no checks
+        if type(json_str) is dict:
             data = json_str
+        else:
+            if isinstance(json_str, str):
+                try:
+                    data = json.loads(json_str)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Invalid JSON string: {e}")
+            else:
+                data = json_str
 
-        if not isinstance(data, dict):
-            raise ValueError("Input must be a dictionary or JSON object")
+            if not isinstance(data, dict):
+                raise ValueError("Input must be a dictionary or JSON object")
 
         # Create new rule instance
         rule = cls()
 
-        # Set basic attributes
-        rule.id = data.get('id', str(uuid.uuid4()))
+        # Set basic attributes, falling back to the id, slug and timestamp the constructor generated
+        rule.id = data.get('id', rule.id)
         rule.name = data.get('name', 'Untitled Rule')
         rule.description = data.get('description', '')
-        rule.slug = data.get('slug', rule._generate_slug())
-        rule.created_at = data.get('createdAt', datetime.utcnow().isoformat() + "Z")
+        rule.slug = data.get('slug', rule.slug)
+        rule.created_at = data.get('createdAt', rule.created_at)
         rule.updated_at = data.get('updatedAt', rule.created_at)
         rule.updated_by = data.get('updatedBy', 'Rulebricks SDK')
         rule.settings = data.get('settings', {})
@@ -552,8 +707,8 @@ class Rule:
         rule.groups = data.get('groups', {})
         rule.published = data.get('published', False)
         rule.published_at = data.get('publishedAt', None)
-        rule.test_suite = data.get('testSuite', [])
-        rule.test_suite = [RuleTest.from_json(test) for test in rule.test_suite]
+        rule.test_suite = [RuleTest._from_dict(test) if isinstance(test, dict) else RuleTest.from_json(test)
+                           for test in data.get('testSuite') or ()]
         rule.access_groups = data.get('accessGroups', [])
         rule.test_request = data.get('testRequest', {})
         rule.folder_id = data.get('tag', None)
@@ -562,39 +717,16 @@ class Rule:
         rule.published_response_schema = data.get('publishedResponseSchema', [])
         rule.published_groups = data.get('publishedGroups', {})
 
-        # Process request schema
-        for field in data.get('requestSchema', []):
-            try:
-                field_type = RuleType(field['type'])
-                if field_type == RuleType.BOOLEAN:
-                    rule.add_boolean_field(field['key'], field.get('description', ''), field.get('defaultValue', False))
-                elif field_type == RuleType.NUMBER:
-                    rule.add_number_field(field['key'], field.get('description', ''), field.get('defaultValue', 0))
-                elif field_type == RuleType.STRING:
-                    rule.add_string_field(field['key'], field.get('description', ''), field.get('defaultValue', ''))
-                elif field_type == RuleType.DATE:
-                    rule.add_date_field(field['key'], field.get('description', ''), field.get('defaultValue'))
-                elif field_type == RuleType.LIST:
-                    rule.add_list_field(field['key'], field.get('description', ''), field.get('defaultValue', []))
-            except KeyError as e:
-                raise ValueError(f"Missing required field in requestSchema: {str(e)}")
-
-        # Process response schema
-        for field in data.get('responseSchema', []):
-            try:
-                field_type = RuleType(field['type'])
-                if field_type == RuleType.BOOLEAN:
-                    rule.add_boolean_response(field['key'], field.get('description', ''), field.get('defaultValue', False))
-                elif field_type == RuleType.NUMBER:
-                    rule.add_number_response(field['key'], field.get('description', ''), field.get('defaultValue', 0))
-                elif field_type == RuleType.STRING:
-                    rule.add_string_response(field['key'], field.get('description', ''), field.get('defaultValue', ''))
-                elif field_type == RuleType.DATE:
-                    rule.add_date_field(field['key'], field.get('description', ''), field.get('defaultValue'))
-                elif field_type == RuleType.LIST:
-                    rule.add_list_field(field['key'], field.get('description', ''), field.get('defaultValue', []))
-            except KeyError as e:
-                raise ValueError(f"Missing required field in responseSchema: {str(e)}")
+        # Process request and response schemas
+        for schema_key, adders in (('requestSchema', _REQUEST_SCHEMA_ADDERS),
+                                   ('responseSchema', _RESPONSE_SCHEMA_ADDERS)):
+            for field in data.get(schema_key, ()):
+                try:
+                    method_name, default = adders[RuleType(field['type'])]
+                    getattr(rule, method_name)(field['key'], field.get('description', ''),
+                                               field.get('defaultValue', default))
+                except KeyError as e:
+                    raise ValueError(f"Missing required field in {schema_key}: {str(e)}")
 
         # Process conditions
         rule.conditions = data.get('conditions', [])
@@ -665,8 +797,7 @@ class Rule:
         Returns:
             str: A random string of alphanumeric characters.
         """
-        characters = string.ascii_letters + string.digits
-        return ''.join(random.choice(characters) for _ in range(length))
+        return _random_alnum(length)
 
     def _get_field_type(self, field: Union[BooleanField, NumberField, StringField, DateField, ListField]) -> RuleType:
         """
@@ -679,14 +810,7 @@ class Rule:
         Returns:
             RuleType: The corresponding RuleType enum value.
         """
-        type_mapping = {
-            BooleanField: RuleType.BOOLEAN,
-            NumberField: RuleType.NUMBER,
-            StringField: RuleType.STRING,
-            DateField: RuleType.DATE,
-            ListField: RuleType.LIST
-        }
-        return type_mapping[field.__class__]
+        return _FIELD_TYPE_MAP[field.__class__]
 
     def set_name(self, name: str) -> 'Rule':
         """
@@ -731,12 +855,11 @@ class Rule:
         """
         if not self.workspace:
             raise ValueError("A Rulebricks client is required to set a folder by name")
-        folders = self.workspace.assets.list_folders()
-        folder = next((f for f in folders if f.name == folder_name), None)
+        folders = self._get_folders()
+        folder = folders.get(folder_name)
         if not folder and create_if_missing:
-            if any(f.name == folder_name for f in folders):
-                raise ValueError("Folder name conflicts with an existing folder")
             folder = self.workspace.assets.upsert_folder(name=folder_name)
+            folders[folder_name] = folder
         if not folder:
             raise ValueError(f"Folder '{folder_name}' not found and create_if_missing is False")
         self.folder_id = folder.id
@@ -770,15 +893,14 @@ class Rule:
         """
         if not self.workspace:
             raise ValueError("A Rulebricks client is required to set an alias")
-        if len(alias) < 3:
-            raise ValueError("Alias must be at least 3 characters long")
-        if '/' in alias or '\\' in alias or ' ' in alias:
-            raise ValueError("Alias cannot contain slashes or spaces")
-        if not all(c in string.ascii_letters + string.digits + '-' for c in alias):
+        if not _ALIAS_RE.fullmatch(alias):
+            if len(alias) < 3:
+                raise ValueError("Alias must be at least 3 characters long")
+            if '/' in alias or '\\' in alias or ' ' in alias:
+                raise ValueError("Alias cannot contain slashes or spaces")
             raise ValueError("Alias cannot contain special characters")
 
-        rules = self.workspace.assets.list_rules()
-        if any(r.slug == alias for r in rules):
+        if alias in self._get_rule_slugs():
             raise ValueError("Alias conflicts with an existing rule")
 
         self.slug = alias
@@ -799,17 +921,49 @@ class Rule:
         Raises:
             ValueError: If workspace client is missing or group operations fail.
         """
+        return self.add_access_groups([group_name], create_if_missing)
+
+    def add_access_groups(self, group_names: Iterable[str], create_if_missing: Optional[bool] = False) -> 'Rule':
+        """
+        Add several user groups that can access this rule.
+
+        The workspace's groups are listed at most once, and every name is checked before
+        any group is created or added.
+
+        Args:
+            group_names (Iterable[str]): Names of the groups to add.
+            create_if_missing (Optional[bool]): Whether to create groups that don't exist.
+                                              Defaults to False.
+
+        Returns:
+            Rule: The current rule instance for method chaining.
+
+        Raises:
+            TypeError: If a single string is passed instead of a collection of names.
+            ValueError: If workspace client is missing or group operations fail.
+
+        Example:
+            >>> rule.add_access_groups(["underwriting", "compliance"], create_if_missing=True)
+        """
+        if isinstance(group_names, str):
+            raise TypeError("add_access_groups expects a collection of group names; "
+                            "use add_access_group for a single group")
         if not self.workspace:
             raise ValueError("A Rulebricks client is required to add access groups")
-        existing_access_groups = self.workspace.users.list_groups()
-        group = next((g for g in existing_access_groups if g.name == group_name), None)
-        if group:
-            self.access_groups.append(group.name)
-        if not group and not create_if_missing:
-            raise ValueError(f"User group '{group_name}' not found and create_if_missing is False")
-        if not group and create_if_missing:
-            created_group = self.workspace.users.create_group(name=group_name)
-            self.access_groups.append(created_group.name)
+        group_names = list(group_names)
+        existing_access_groups = self._get_groups()
+        if not create_if_missing:
+            for group_name in group_names:
+                if not existing_access_groups.get(group_name):
+                    raise ValueError(f"User group '{group_name}' not found and create_if_missing is False")
+        for group_name in group_names:
+            group = existing_access_groups.get(group_name)
+            if not group:
+                group = self.workspace.users.create_group(name=group_name)
+                existing_access_groups[group.name] = group
+            # A group is only listed once, however many times it is added
+            if group.name not in self.access_groups:
+                self.access_groups.append(group.name)
         return self
 
     def remove_access_group(self, group_name: str) -> 'Rule':
@@ -822,8 +976,10 @@ class Rule:
         Returns:
             Rule: The current rule instance for method chaining.
         """
-        if group_name in self.access_groups:
+        try:
             self.access_groups.remove(group_name)
+        except ValueError:
+            pass
         return self
 
     def enable_continous_testing(self, enabled: bool = True) -> 'Rule':
@@ -878,6 +1034,18 @@ class Rule:
         self.settings["lockSchema"] = enabled
         return self
 
+    def _add_request(self, field_class: type, name: str, description: str, default: Any) -> Any:
+        """Create a field of the given class and add it to the request schema"""
+        field = field_class(name, description, default)
+        self.request_fields[name] = field
+        return field
+
+    def _add_response(self, field_class: type, name: str, description: str, default: Any) -> Any:
+        """Create a field of the given class and add it to the response schema"""
+        field = field_class(name, description, default)
+        self.response_fields[name] = field
+        return field
+
     def add_boolean_field(self, name: str, description: str = "", default: bool = False) -> BooleanField:
         """
         Add a boolean request field to the rule.
@@ -893,9 +1061,7 @@ class Rule:
         Example:
             >>> rule.add_boolean_field('is_active', 'Whether the account is active', True)
         """
-        field = BooleanField(name, description, default)
-        self.request_fields[name] = field
-        return field
+        return self._add_request(BooleanField, name, description, default)
 
     def add_number_field(self, name: str, description: str = "", default: Union[int, float] = 0) -> NumberField:
         """
@@ -912,9 +1078,7 @@ class Rule:
         Example:
             >>> rule.add_number_field('age', 'Age in years', 18)
         """
-        field = NumberField(name, description, default)
-        self.request_fields[name] = field
-        return field
+        return self._add_request(NumberField, name, description, default)
 
     def add_string_field(self, name: str, description: str = "", default: str = "") -> StringField:
         """
@@ -937,9 +1101,7 @@ class Rule:
         Example:
             >>> rule.add_string_field("username", "User's login name", "guest")
         """
-        field = StringField(name, description, default)
-        self.request_fields[name] = field
-        return field
+        return self._add_request(StringField, name, description, default)
 
     def add_date_field(self, name: str, description: str = "", default: Optional[datetime] = None) -> DateField:
         """
@@ -963,9 +1125,7 @@ class Rule:
             >>> from datetime import datetime
             >>> rule.add_date_field("created_at", "Record creation date", datetime.now())
         """
-        field = DateField(name, description, default)
-        self.request_fields[name] = field
-        return field
+        return self._add_request(DateField, name, description, default)
 
     def add_list_field(self, name: str, description: str = "", default: Optional[List] = None) -> ListField:
         """
@@ -989,9 +1149,7 @@ class Rule:
         Example:
             >>> rule.add_list_field("tags", "Item categories", ["default", "basic"])
         """
-        field = ListField(name, description, default or [])
-        self.request_fields[name] = field
-        return field
+        return self._add_request(ListField, name, description, default)
 
     def add_boolean_response(self, name: str, description: str = "", default: bool = False) -> BooleanField:
         """
@@ -1014,9 +1172,7 @@ class Rule:
         Example:
             >>> rule.add_boolean_response("is_approved", "Whether the request was approved", False)
         """
-        field = BooleanField(name, description, default)
-        self.response_fields[name] = field
-        return field
+        return self._add_response(BooleanField, name, description, default)
 
     def add_number_response(self, name: str, description: str = "", default: Union[int, float] = 0) -> NumberField:
         """
@@ -1039,9 +1195,7 @@ class Rule:
         Example:
             >>> rule.add_number_response("total_amount", "Calculated total", 0.0)
         """
-        field = NumberField(name, description, default)
-        self.response_fields[name] = field
-        return field
+        return self._add_response(NumberField, name, description, default)
 
     def add_string_response(self, name: str, description: str = "", default: str = "") -> StringField:
         """
@@ -1064,9 +1218,7 @@ class Rule:
         Example:
             >>> rule.add_string_response("message", "Response message to user", "Success")
         """
-        field = StringField(name, description, default)
-        self.response_fields[name] = field
-        return field
+        return self._add_response(StringField, name, description, default)
 
     def add_date_response(self, name: str, description: str = "", default: Optional[datetime] = None) -> DateField:
         """
@@ -1089,9 +1241,7 @@ class Rule:
         Example:
             >>> rule.add_date_response("processed_at", "Time of processing")
         """
-        field = DateField(name, description, default)
-        self.response_fields[name] = field
-        return field
+        return self._add_response(DateField, name, description, default)
 
     def add_list_response(self, name: str, description: str = "", default: Optional[List] = None) -> ListField:
         """
@@ -1114,9 +1264,7 @@ class Rule:
         Example:
             >>> rule.add_list_response("errors", "List of validation errors", [])
         """
-        field = ListField(name, description, default or [])
-        self.response_fields[name] = field
-        return field
+        return self._add_response(ListField, name, description, default)
 
     def when(self, **conditions) -> Condition:
         """
@@ -1179,6 +1327,15 @@ class Rule:
             settings=self.conditions[index].get("settings", {})
         )
 
+    def _get_request_field(self, name: str, field_class: type, kind: str) -> Any:
+        """Get a request field by name, checking that it is an instance of the given field class"""
+        field = self.request_fields.get(name)
+        if field is None:
+            raise ValueError(f"Field '{name}' not found in request schema")
+        if not isinstance(field, field_class):
+            raise ValueError(f"Field '{name}' is not a {kind} field")
+        return field
+
     def get_boolean_field(self, name: str) -> BooleanField:
         """
         Get a boolean field from the rule's request schema by name.
@@ -1196,11 +1353,7 @@ class Rule:
             >>> is_active = rule.get_boolean_field("is_active")
             >>> matched_conditions = rule.find_conditions(is_active=is_active.equals(True))
         """
-        if name not in self.request_fields:
-            raise ValueError(f"Field '{name}' not found in request schema")
-        elif not isinstance(self.request_fields[name], BooleanField):
-            raise ValueError(f"Field '{name}' is not a boolean field")
-        return self.request_fields[name] # type: ignore
+        return self._get_request_field(name, BooleanField, "boolean")
 
     def get_number_field(self, name: str) -> NumberField:
         """
@@ -1219,11 +1372,7 @@ class Rule:
             >>> amount = rule.get_number_field("amount")
             >>> matched_conditions = rule.find_conditions(amount=amount.greater_than(1000))
         """
-        if name not in self.request_fields:
-            raise ValueError(f"Field '{name}' not found in request schema")
-        elif not isinstance(self.request_fields[name], NumberField):
-            raise ValueError(f"Field '{name}' is not a number field")
-        return self.request_fields[name] # type: ignore
+        return self._get_request_field(name, NumberField, "number")
 
     def get_string_field(self, name: str) -> StringField:
         """
@@ -1242,11 +1391,7 @@ class Rule:
             >>> status = rule.get_string_field("status")
             >>> matched_condtions = rule.find_conditions(status=status.equals("active"))
         """
-        if name not in self.request_fields:
-            raise ValueError(f"Field '{name}' not found in request schema")
-        elif not isinstance(self.request_fields[name], StringField):
-            raise ValueError(f"Field '{name}' is not a string field")
-        return self.request_fields[name] # type: ignore
+        return self._get_request_field(name, StringField, "string")
 
     def get_date_field(self, name: str) -> DateField:
         """
@@ -1267,11 +1412,7 @@ class Rule:
             ...     datetime(2021, 1, 1)
             ... ))
         """
-        if name not in self.request_fields:
-            raise ValueError(f"Field '{name}' not found in request schema")
-        elif not isinstance(self.request_fields[name], DateField):
-            raise ValueError(f"Field '{name}' is not a date field")
-        return self.request_fields[name] # type: ignore
+        return self._get_request_field(name, DateField, "date")
 
     def get_list_field(self, name: str) -> ListField:
         """
@@ -1290,11 +1431,7 @@ class Rule:
             >>> tags = rule.get_list_field("tags")
             >>> matched_conditions = rule.find_conditions(tags=tags.contains("important"))
         """
-        if name not in self.request_fields:
-            raise ValueError(f"Field '{name}' not found in request schema")
-        elif not isinstance(self.request_fields[name], ListField):
-            raise ValueError(f"Field '{name}' is not a list field")
-        return self.request_fields[name] # type: ignore
+        return self._get_request_field(name, ListField, "list")
 
     def find_conditions(self, **kwargs) -> List[Condition]:
         """
@@ -1320,35 +1457,39 @@ class Rule:
             ...     estimated_premium=3000
             ... )
         """
-        results = []
-        for i, condition in enumerate(self.conditions):
-            matches = True
-            for field, (operator, args) in kwargs.items():
-                if field not in condition["request"]:
-                    matches = False
-                    break
-                request = condition["request"][field]
-                if request["op"] != operator:
-                    matches = False
-                    break
-                # Compare args (ignoring DynamicValues)
-                if any(isinstance(a, DynamicValue) for a in args):
-                    continue
-                # Convert both sets of args to strings for comparison
-                existing_args = [str(arg) for arg in request["args"]]
-                search_args = [str(arg) for arg in args]
-                if existing_args != search_args:
-                    matches = False
-                    break
-            if matches:
-                results.append(Condition(
-                    rule=self,
-                    conditions=condition.get("request", {}),
-                    index=i,
-                    settings=condition.get("settings", {})
-                ))
-
-        return results
+        conditions = self.conditions
+        if kwargs:
+            # Resolve each criterion once up front, so the conditions are scanned in a
+            # single pass. Any arguments match when searching with DynamicValues; otherwise
+            # the arguments are compared as strings.
+            criteria = [
+                (field, operator,
+                 None if any(isinstance(a, DynamicValue) for a in args) else [str(arg) for arg in args])
+                for field, (operator, args) in kwargs.items()
+            ]
+            candidates: Any = []
+            for i, condition in enumerate(conditions):
+                request = condition["request"]
+                for field, operator, search_args in criteria:
+                    entry = request.get(field)
+                    if entry is None or entry["op"] != operator:
+                        break
+                    if search_args is not None and [str(arg) for arg in entry["args"]] != search_args:
+                        break
+                else:
+                    candidates.append(i)
+        else:
+            candidates = range(len(conditions))
+
+        return [
+            Condition(
+                rule=self,
+                conditions=conditions[i].get("request", {}),
+                index=i,
+                settings=conditions[i].get("settings", {})
+            )
+            for i in candidates
+        ]
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -1366,22 +1507,8 @@ class Rule:
             >>> print(rule_dict['name'], rule_dict['conditions'])
         """
         # Use request fields and response fields to generate sampleRequest and sampleResponse json
-        sampleRequest = {}
-        sampleResponse = {}
-
-        for name, field in self.request_fields.items():
-            parts = name.split('.')
-            current = sampleRequest
-            for part in parts[:-1]:
-                current = current.setdefault(part, {})
-            current[parts[-1]] = field.default
-
-        for name, field in self.response_fields.items():
-            parts = name.split('.')
-            current = sampleResponse
-            for part in parts[:-1]:
-                current = current.setdefault(part, {})
-            current[parts[-1]] = field.default
+        sampleRequest = _build_sample(self.request_fields)
+        sampleResponse = _build_sample(self.response_fields)
 
         return {
             "id": self.id,
@@ -1404,10 +1531,10 @@ class Rule:
             "requestSchema": [
                 {
                     "key": name,
-                    "name": field.name.replace('_', ' ').title(),
-                    "type": self._get_field_type(field).value,
+                    "name": _display_name(field.name),
+                    "type": _FIELD_TYPE_MAP[field.__class__].value,
                     "description": field.description,
-                    "defaultValue": field.default,
+                    "defaultValue": _export_default(field),
                     "show": True
                 }
                 for name, field in self.request_fields.items()
@@ -1415,10 +1542,10 @@ class Rule:
             "responseSchema": [
                 {
                     "key": name,
-                    "name": field.name.replace('_', ' ').title(),
-                    "type": self._get_field_type(field).value,
+                    "name": _display_name(field.name),
+                    "type": _FIELD_TYPE_MAP[field.__class__].value,
                     "description": field.description,
-                    "defaultValue": field.default,
+                    "defaultValue": _export_default(field),
                     "show": True
                 }
                 for name, field in self.response_fields.items()
@@ -1469,37 +1596,37 @@ class Rule:
             | (18)          | ("active")     |               |
             +----------------+----------------+----------------+
         """
-        from tabulate import tabulate
+        tabulate = _get_tabulate()
 
         # Get all field names for headers
-        headers = list(self.request_fields.keys()) + list(self.response_fields.keys())
+        request_keys = list(self.request_fields)
+        response_keys = list(self.response_fields)
+        headers = request_keys + response_keys
+        request_columns = {name: i for i, name in enumerate(request_keys)}
+        response_columns = {name: i for i, name in enumerate(response_keys, len(request_keys))}
         table_data = []
 
         for condition in self.conditions:
-            row = []
+            # Start from an all-empty row and fill in the columns this condition sets;
+            # fields that are not in the schema are not shown
+            row: List[Any] = ["-"] * len(headers)
 
             # Add request field values
-            for field_name in self.request_fields.keys():
-                if field_name in condition["request"]:
-                    rule = condition["request"][field_name]
-                    op_name = rule["op"]
-                    arguments_repr = []
-                    for arg in rule["args"]:
-                        if isinstance(arg, Dict) and "$rb" in arg:
-                            arguments_repr.append(arg["name"].upper())
-                        else:
-                            arguments_repr.append(str(arg))
+            for field_name, request in condition["request"].items():
+                column = request_columns.get(field_name)
+                if column is not None:
+                    arguments_repr = [
+                        arg["name"].upper() if isinstance(arg, dict) and "$rb" in arg else str(arg)
+                        for arg in request["args"]
+                    ]
                     args_str = ", ".join(arguments_repr)
-                    row.append(f"{op_name}\n({args_str})")
-                else:
-                    row.append("-")
+                    row[column] = f"{request['op']}\n({args_str})"
 
             # Add response field values
-            for field_name in self.response_fields.keys():
-                if field_name in condition["response"]:
-                    row.append(condition["response"][field_name]["value"])
-                else:
-                    row.append("-")
+            for field_name, response in condition["response"].items():
+                column = response_columns.get(field_name)
+                if column is not None:
+                    row[column] = response["value"]
 
             table_data.append(row)
 
@@ -1524,19 +1651,22 @@ class Rule:
             >>> file_name = rule.export()
             >>> print(f"Rule exported to {file_name}")
         """
-        base_name = re.sub(r'[^\w\-_\. ]', '_', self.name)
-        base_name = base_name.replace(' ', '_')
-        filename = f"{base_name}-Generated.rbx"
+        base_name = _FILENAME_UNSAFE_RE.sub('_', self.name)
+        stem = f"{base_name}-Generated"
 
         if directory:
             os.makedirs(directory, exist_ok=True)
-            filename = os.path.join(directory, filename)
 
-        # Ensure filename is unique
+        # Ensure filename is unique, taking the first free of stem.rbx, stem_1.rbx, stem_2.rbx...
+        # from one directory listing; the final exists() check covers case-insensitive filesystems
+        with os.scandir(directory or os.curdir) as entries:
+            existing = {entry.name for entry in entries if entry.name.startswith(stem)}
+        basename = f"{stem}.rbx"
+        filename = os.path.join(directory, basename) if directory else basename
         counter = 1
-        while os.path.exists(filename):
-            name_parts = filename.rsplit('-Generated', 1)
-            filename = f"{name_parts[0]}-Generated_{counter}.rbx"
+        while basename in existing or os.path.exists(filename):
+            basename = f"{stem}_{counter}.rbx"
+            filename = os.path.join(directory, basename) if directory else basename
             counter += 1
 
         with open(filename, 'w') as f:
@@ -1636,3 +1766,20 @@ class Rule:
         test = self.find_test_by_id(test_id)
         if test:
             self.test_suite.remove(test)
+
+# Schema type -> (name of the Rule method adding the field, default value when none is given),
+# used by from_json. Methods are looked up on the instance so that subclass overrides apply.
+_REQUEST_SCHEMA_ADDERS = {
+    RuleType.BOOLEAN: ('add_boolean_field', False),
+    RuleType.NUMBER: ('add_number_field', 0),
+    RuleType.STRING: ('add_string_field', ''),
+    RuleType.DATE: ('add_date_field', None),
+    RuleType.LIST: ('add_list_field', None)
+}
+_RESPONSE_SCHEMA_ADDERS = {
+    RuleType.BOOLEAN: ('add_boolean_response', False),
+    RuleType.NUMBER: ('add_number_response', 0),
+    RuleType.STRING: ('add_string_response', ''),
+    RuleType.DATE: ('add_date_response', None),
+    RuleType.LIST: ('add_list_response', None)
+}
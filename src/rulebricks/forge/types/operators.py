@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Any, List, Optional, Dict, Callable
+from typing import Any, List, Optional, Mapping, Callable
 from dataclasses import dataclass, field
 
 @dataclass
@@ -27,7 +27,7 @@ class Field:
     name: str
     description: str = ""
     default: Any = None
-    operators: Dict[str, OperatorDef] = field(default_factory=dict)
+    operators: Mapping[str, OperatorDef] = field(default_factory=dict)
 
 class RuleType(Enum):
     """Supported rule types"""
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Optional
 
 class DynamicValueType(Enum):
     """Matches the SDK's ListDynamicValuesResponseItemType"""
@@ -14,5 +15,14 @@ class DynamicValueNotFoundError(Exception):
     pass
 
 class TypeMismatchError(Exception):
-    """Raised when a dynamic value's type doesn't match the expected type"""
-    pass
+    """
+    Raised when a dynamic value's type doesn't match the expected type
+
+    Can be raised with a ready-made message, or with the dynamic value's name and actual
+    type (plus the expected type) to build the standard message.
+    """
+    def __init__(self, name_or_message: str, actual_type: Optional[str] = None, expected_type: str = "list"):
+        if actual_type is not None:
+            name_or_message = (f"Dynamic value '{name_or_message}' has type {actual_type}, "
+                               f"but {expected_type} was expected")
+        super().__init__(name_or_message)
@@ -1,6 +1,7 @@
 from .types import DynamicValueNotFoundError, DynamicValueType
 from typing import Dict, Any, Type
 from datetime import datetime
+import functools
 
 class DynamicValue:
     """A reference to a dynamic value in the platform"""
@@ -18,6 +19,7 @@ class DynamicValue:
         }
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_expected_type(value_type: DynamicValueType) -> Type:
         """Get the Python type that corresponds to a DynamicValueType"""
         type_mapping = {
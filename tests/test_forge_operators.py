@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from rulebricks.forge import DynamicValue, ListField, NumberField, StringField, DateField, TypeMismatchError
+from rulebricks.forge.types import DynamicValueType
+
+
+def test_spec_cache_hit_and_miss() -> None:
+    age = NumberField("age")
+    other = NumberField("other")
+    spec = age.between(18, 35)
+    assert age.between(18, 35) is spec
+    assert other.between(18, 35) is spec  # Shared across fields of the same class
+    assert age.between(18, 36) is not spec
+    assert spec[0] == "between"
+    assert [arg.value for arg in spec[1]] == [18, 35]
+
+
+def test_spec_cache_keeps_types_distinct() -> None:
+    n = NumberField("n")
+    assert type(n.equals(1)[1][0].value) is int
+    assert type(n.equals(1.0)[1][0].value) is float
+    assert n.equals(1) is not n.equals(1.0)
+
+
+def test_spec_cache_distinguishes_signed_zero() -> None:
+    n = NumberField("n")
+    assert str(n.equals(0.0)[1][0].value) == "0.0"
+    assert str(n.equals(-0.0)[1][0].value) == "-0.0"
+    assert str(n.equals(0.0)[1][0].value) == "0.0"
+
+
+def test_spec_cache_distinguishes_aware_datetimes() -> None:
+    d = DateField("d")
+    utc = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+    plus_two = utc.astimezone(timezone(timedelta(hours=2)))
+    assert utc == plus_two
+    assert d.after(utc)[1][0].value.tzinfo is timezone.utc
+    assert d.after(plus_two)[1][0].value.utcoffset() == timedelta(hours=2)
+
+
+def test_spec_cache_does_not_share_argument_lists() -> None:
+    s = StringField("s")
+    first = s.is_included_in(("a", "b"))
+    second = s.is_included_in(("a", "b"))
+    assert first[1][0] is not second[1][0]
+    first[1][0].pop()
+    assert [arg.value for arg in second[1][0]] == ["a", "b"]
+    assert [arg.value for arg in s.is_included_in(("a", "b"))[1][0]] == ["a", "b"]
+    from_string = s.is_included_in("ab")
+    assert s.is_included_in("ab")[1][0] is not from_string[1][0]
+    from_string[1][0].clear()
+    assert [arg.value for arg in s.is_included_in("ab")[1][0]] == ["a", "b"]
+
+
+def test_spec_cache_keyword_calls() -> None:
+    n = NumberField("n")
+    spec = n.between(start=1, end=2)
+    assert spec[0] == "between"
+    assert [arg.value for arg in spec[1]] == [1, 2]
+    assert [arg.value for arg in n.between(1, end=2)[1]] == [1, 2]
+
+
+def test_spec_cache_does_not_cache_errors() -> None:
+    n = NumberField("n")
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            n.between(5, 1)
+        with pytest.raises(TypeMismatchError):
+            n.equals("5")
+    assert [arg.value for arg in n.between(1, 5)[1]] == [1, 5]
+
+
+def test_spec_cache_with_dynamic_values() -> None:
+    limit = DynamicValue("id-1", "limit", DynamicValueType.NUMBER)
+    n = NumberField("n")
+    assert n.greater_than(limit)[1][0].to_dict() == {"id": "id-1", "$rb": "globalValue", "name": "limit"}
+    assert n.greater_than(limit) is n.greater_than(limit)
+    other = DynamicValue("id-1", "limit", DynamicValueType.NUMBER)
+    assert n.greater_than(other)[1][0].value is other
+
+
+def test_regex_validation_accepts_other_dialects() -> None:
+    s = StringField("s")
+    for pattern in (r"(?<year>\d{4})", r"^\p{L}+$", r"(?<x>a)\k<x>", r"[(]", r"a\)"):
+        assert s.matches_regex(pattern)[1][0].value == pattern
+
+
+@pytest.mark.parametrize("pattern", ["(a", "a)", "[a", "a\\"])
+def test_regex_validation_rejects_unbalanced_syntax(pattern: str) -> None:
+    with pytest.raises(ValueError):
+        StringField("s").matches_regex(pattern)
+
+
+def test_is_power_of_two() -> None:
+    n = NumberField("n")
+    operator, args = n.is_power_of_two()
+    assert operator == "is a power of"
+    assert [arg.to_dict() for arg in args] == [2]
+    assert [arg.to_dict() for arg in n.is_power_of(2)[1]] == [2]
+
+
+def test_contains_numeric() -> None:
+    tags = ListField("tags")
+    operator, args = tags.contains_all_numeric([1, 2.5, True])
+    assert operator == "contains all of"
+    assert list(args) == [[1, 2.5, True]]
+    operator, args = tags.contains_any_numeric(range(3))
+    assert operator == "contains any of"
+    assert list(args) == [[0, 1, 2]]
+    with pytest.raises(TypeMismatchError):
+        tags.contains_any_numeric([1, "2"])
+
+
+def test_list_builders_accept_iterators() -> None:
+    tags = ListField("tags")
+    items = [{"id": 1}, {"id": 2}]
+    operator, args = tags.contains_all(item for item in items)
+    assert operator == "contains all of"
+    assert [arg.to_dict() for arg in args[0]] == items
+    assert [arg.to_dict() for arg in tags.equals(iter(items[:1]))[1][0]] == items[:1]
+    assert tags.is_sublist_of(iter([]))[1] == ([],)
+
+
+def test_type_mismatch_error_message() -> None:
+    name = DynamicValue("id-2", "name", DynamicValueType.STRING)
+    with pytest.raises(TypeMismatchError) as excinfo:
+        NumberField("n").equals(name)
+    message = "Dynamic value 'name' has type string, but number was expected"
+    assert excinfo.value.args == (message,)
+    assert str(excinfo.value) == message
+    with pytest.raises(TypeMismatchError) as excinfo:
+        ListField("tags").contains_all(name)
+    assert excinfo.value.args == ("Dynamic value 'name' has type string, but list was expected",)
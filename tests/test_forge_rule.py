@@ -0,0 +1,170 @@
+import json
+import math
+from types import SimpleNamespace
+from typing import Any, List
+
+import pytest
+
+from rulebricks.forge import Rule
+from rulebricks.forge import rule as rule_module
+
+
+def _make_rule() -> Rule:
+    rule = Rule()
+    age = rule.add_number_field("age")
+    status = rule.add_string_field("status")
+    rule.add_number_response("premium")
+    rule.when(age=age.greater_than(18), status=status.equals("active")).then(premium=1)
+    rule.when(age=age.greater_than(30)).then(premium=2)
+    rule.when(age=age.greater_than(18)).then(premium=3)
+    return rule
+
+
+def _premiums(rule: Rule, **criteria: Any) -> List[Any]:
+    return [rule.conditions[c.index]["response"]["premium"]["value"] for c in rule.find_conditions(**criteria)]
+
+
+def test_find_conditions() -> None:
+    rule = _make_rule()
+    age = rule.get_number_field("age")
+    status = rule.get_string_field("status")
+    assert _premiums(rule) == [1, 2, 3]
+    assert _premiums(rule, age=age.greater_than(18)) == [1, 3]
+    assert _premiums(rule, age=age.greater_than(18), status=status.equals("active")) == [1]
+    assert _premiums(rule, age=age.less_than(18)) == []
+    assert _premiums(rule, status=status.equals("inactive")) == []
+
+
+def test_find_conditions_after_reorder() -> None:
+    rule = _make_rule()
+    age = rule.get_number_field("age")
+    assert _premiums(rule, age=age.greater_than(18)) == [1, 3]
+    rule.conditions.reverse()
+    assert [c.index for c in rule.find_conditions(age=age.greater_than(18))] == [0, 2]
+    assert _premiums(rule, age=age.greater_than(18)) == [3, 1]
+
+
+def test_find_conditions_after_edit() -> None:
+    rule = _make_rule()
+    age = rule.get_number_field("age")
+    assert _premiums(rule, age=age.greater_than(30)) == [2]
+    rule.conditions[2]["request"]["age"]["args"] = [30]
+    assert _premiums(rule, age=age.greater_than(30)) == [2, 3]
+    rule.get_condition(0).when(age=age.greater_than(30))
+    assert _premiums(rule, age=age.greater_than(30)) == [1, 2, 3]
+    assert _premiums(rule, age=age.greater_than(18)) == []
+
+
+def test_find_conditions_after_delete() -> None:
+    rule = _make_rule()
+    age = rule.get_number_field("age")
+    assert _premiums(rule, age=age.greater_than(18)) == [1, 3]
+    rule.get_condition(0).delete()
+    assert _premiums(rule, age=age.greater_than(18)) == [3]
+    del rule.conditions[1]
+    assert _premiums(rule, age=age.greater_than(18)) == []
+
+
+def test_json_output() -> None:
+    rule = Rule().set_name("Prämie")
+    rule.add_number_field("score", default=math.nan)
+    encoded = rule.to_json()
+    assert encoded == json.dumps(rule.to_dict(), indent=2, default=str)
+    assert "Pr\\u00e4mie" in encoded
+    assert "NaN" in encoded
+
+
+def test_export_matches_to_json(tmp_path: Any) -> None:
+    rule = Rule().set_name("Prämie")
+    rule.add_number_field("score", default=math.inf)
+    with open(rule.export(str(tmp_path))) as f:
+        assert f.read() == rule.to_json()
+
+
+def test_from_json_uses_subclass_adders() -> None:
+    added = []
+
+    class TrackingRule(Rule):
+        def add_number_field(self, *args: Any, **kwargs: Any) -> Any:
+            added.append(args[0])
+            return super().add_number_field(*args, **kwargs)
+
+    rule = TrackingRule.from_json(_make_rule().to_dict())
+    assert isinstance(rule, TrackingRule)
+    assert added == ["age"]
+
+
+def _stub_workspace(calls: List[str]) -> SimpleNamespace:
+    def list_groups() -> List[SimpleNamespace]:
+        calls.append("list_groups")
+        return [SimpleNamespace(name="admins"), SimpleNamespace(name="auditors")]
+
+    def create_group(name: str) -> SimpleNamespace:
+        calls.append("create_group")
+        return SimpleNamespace(name=name)
+
+    return SimpleNamespace(users=SimpleNamespace(list_groups=list_groups, create_group=create_group))
+
+
+def test_add_access_groups() -> None:
+    calls: List[str] = []
+    rule = Rule()
+    rule.workspace = _stub_workspace(calls)
+    rule.add_access_groups(["admins", "auditors", "admins"])
+    rule.add_access_group("admins")
+    assert rule.access_groups == ["admins", "auditors"]
+    assert calls == ["list_groups"]
+
+    with pytest.raises(ValueError):
+        rule.add_access_groups(["admins", "missing"])
+    assert rule.access_groups == ["admins", "auditors"]
+
+    rule.add_access_groups(["ops"], create_if_missing=True)
+    rule.add_access_group("ops")
+    assert rule.access_groups == ["admins", "auditors", "ops"]
+    assert calls == ["list_groups", "create_group"]
+
+
+def test_add_access_groups_rejects_string() -> None:
+    rule = Rule()
+    rule.workspace = _stub_workspace([])
+    with pytest.raises(TypeError):
+        rule.add_access_groups("admins")  # type: ignore
+    assert rule.access_groups == []
+
+
+def test_refresh_workspace_cache() -> None:
+    calls: List[str] = []
+    rule = Rule()
+    rule.workspace = _stub_workspace(calls)
+    rule.add_access_group("admins")
+    assert rule.refresh_workspace_cache() is rule
+    rule.add_access_group("auditors")
+    assert calls == ["list_groups", "list_groups"]
+
+
+def test_workspace_cache_expires(monkeypatch: Any) -> None:
+    clock = [1000.0]
+    monkeypatch.setattr(rule_module.time, "monotonic", lambda: clock[0])
+    calls: List[str] = []
+    rule = Rule()
+    rule.workspace = _stub_workspace(calls)
+    rule.add_access_group("admins")
+    clock[0] += rule_module._WORKSPACE_CACHE_TTL - 1
+    rule.add_access_group("auditors")
+    assert calls == ["list_groups"]
+    clock[0] += 1
+    rule.add_access_group("admins")
+    assert calls == ["list_groups", "list_groups"]
+
+
+def test_to_dict_writes_list_defaults_as_lists() -> None:
+    rule = Rule()
+    rule.add_list_field("tags")
+    rule.add_list_field("empty", default=[])
+    rule.add_list_response("errors")
+    data = rule.to_dict()
+    assert data["sampleRequest"] == {"tags": [], "empty": []}
+    assert type(data["sampleRequest"]["tags"]) is list
+    assert [type(row["defaultValue"]) for row in data["requestSchema"]] == [list, list]
+    assert type(data["responseSchema"][0]["defaultValue"]) is list